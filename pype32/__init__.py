@@ -116,9 +116,6 @@ __all__ = [
             "Directory", 
             
             # from directories import *
-            "Directory",
-            "DataDirectory",
-            "ImageImportDescriptor",
             "ImageBoundForwarderRefEntry",
             "ImageBoundForwarderRef",
             "ImageBoundImportDescriptor",
@@ -149,10 +146,18 @@ __all__ = [
 
 from datadirs import Directory, DataDirectory
 from datatypes import String, AlignedString, Array, BYTE, WORD, DWORD, QWORD
-from directories import *
-from excep import *
+from directories import ImageBoundForwarderRefEntry, ImageBoundForwarderRef, ImageBoundImportDescriptor, \
+    ImageBoundImportDescriptorEntry, TLSDirectory, TLSDirectory64, ImageLoadConfigDirectory, ImageLoadConfigDirectory64, \
+    ImageBaseRelocationEntry, ImageBaseRelocation, ImageDebugDirectory, ImageDebugDirectories, ImageImportDescriptorMetaData, \
+    ImageImportDescriptorEntry, ImageImportDescriptor, ImportAddressTableEntry, ImportAddressTableEntry64, ImportAddressTable, \
+    ExportTable, ExportTableEntry, ImageExportTable, NETDirectory, NetDirectory, NetMetaDataHeader, NetMetaDataStreamEntry, \
+    NetMetaDataStreams, NetMetaDataTableHeader, NetMetaDataTables, NetResources
+from excep import PyPe32Exception, PyPe32Warning, PEWarning, PEException, NotValidPathException, WrongOffsetValueException, \
+    DirectoryEntriesLengthException, TypeNotSupportedException, ArrayTypeException, DataLengthException, ReadDataOffsetException, \
+    WriteDataOffsetException, InstanceErrorException, DataMismatchException, SectionHeadersException, DirectoryEntryException, \
+    InvalidParameterException
 from utils import ReadData, WriteData
-from pype32 import *
+from pype32 import PE, FileHeader, DosHeader, NtHeaders, OptionalHeader, OptionalHeader64, SectionHeader, SectionHeaders, Sections
 
 # Library version
 version_number = 0.1
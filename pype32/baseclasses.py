@@ -34,8 +34,64 @@ Base classes.
 
 __revision__ = "$Id$"
 
+import operator
+
+def _binop(op):
+    """
+    Builds a binary operator method for L{DataTypeBaseClass}.
+
+    @type op: function
+    @param op: The function from the C{operator} module to apply over the values.
+
+    @rtype: function
+    @return: A method that applies C{op} to the object's value and the other operand (or its value, if it is a L{DataTypeBaseClass} object).
+    """
+    def f(self, other):
+        if isinstance(other, DataTypeBaseClass):
+            other = other.value
+        return op(self.value, other)
+    f.__name__ = "__%s__" % op.__name__.strip("_")
+    return f
+
+def _getState(self):
+    """
+    Returns the state of an object whose class declares C{__slots__}, so it can be pickled and copied.
+
+    @rtype: dict
+    @return: A dictionary with the value of every slot that is set, plus the instance C{__dict__} (if any).
+    """
+    state = dict(getattr(self, "__dict__", {}))
+    for cls in type(self).__mro__:
+        for name in cls.__dict__.get("__slots__", ()):
+            if name not in ("__dict__", "__weakref__"):
+                try:
+                    state[name] = object.__getattribute__(self, name)
+                except AttributeError:
+                    pass
+    return state
+
+def _setState(self, state):
+    """
+    Restores the state returned by L{_getState}.
+
+    @type state: dict
+    @param state: The attributes of the object.
+    """
+    for name, value in state.iteritems():
+        object.__setattr__(self, name, value)
+
 class BaseStructClass(object):
     """ Base class containing methods used by many others classes in the library."""
+
+    # names of the fields of the structure, in the same order they are packed. Subclasses
+    # override it at class level, so it is shared by every instance instead of being rebuilt in __init__.
+    _attrsList = ()
+
+    # subclasses may declare their fields as __slots__ (usually __slots__ = _attrsList) so they are
+    # stored in the instance itself. The __dict__ is kept for any other attribute set on a structure,
+    # and it is only created when the first one is set.
+    __slots__ = ("shouldPack", "__dict__")
+
     def __init__(self,  shouldPack = True):
         """
         @type shouldPack: bool
@@ -43,21 +99,30 @@ class BaseStructClass(object):
         set to C{False}, the class will not be packed.
         """
         self.shouldPack = shouldPack
-        self._attrsList = []
 
     def __str__(self):
-        s = ""
-        for i in self._attrsList:
-            attr = getattr(self,  i)
-            if hasattr(attr, "shouldPack") and attr.shouldPack:
-                s += str(attr)
-        return s
+        attrs = [getattr(self, i) for i in self._attrsList]
+        return "".join([str(attr) for attr in attrs if getattr(attr, "shouldPack", False)])
         
     def __len__(self):
-        return len(str(self))
+        # add up the size of every packed field instead of building the whole string.
+        # list-like containers (Array, DataDirectory, etc) report the number of elements
+        # with len(), so we still need their packed representation to get the size.
+        size = 0
+        for i in self._attrsList:
+            attr = getattr(self,  i)
+            if getattr(attr, "shouldPack", False):
+                if isinstance(attr, (list, dict)):
+                    size += len(str(attr))
+                else:
+                    size += len(attr)
+        return size
 
     def __dir__(self):
-        return sorted(self._attrsList or self.__dict__.keys())
+        return sorted(self._attrsList or getattr(self, "__dict__", {}).keys())
+
+    __getstate__ = _getState
+    __setstate__ = _setState
 
     def sizeof(self):
         return len(self)
@@ -69,12 +134,7 @@ class BaseStructClass(object):
         @rtype: dict
         @return: A dictionary containing all the class attributes.
         """
-        d = {}
-        for i in self._attrsList:
-            key = i
-            value = getattr(self,  i)
-            d[key] = value
-        return d
+        return {i: getattr(self, i) for i in self._attrsList}
         
     def getType(self):
         """
@@ -86,6 +146,8 @@ class BaseStructClass(object):
         raise NotImplementedError("getType() method not implemented.")
         
 class DataTypeBaseClass(object):
+    __slots__ = ("value", "endianness", "signed", "shouldPack")
+
     def __init__(self, value = 0, endianness = "<", signed = False, shouldPack = True):
         """
         @type value: int
@@ -106,167 +168,24 @@ class DataTypeBaseClass(object):
         self.shouldPack = shouldPack
 
     def __dir__(self):
-        return sorted(self.__dict__.keys())
+        return sorted(DataTypeBaseClass.__slots__)
 
-    def __eq__(self, other):
-        result = None
-        
-        if isinstance(other, self.__class__):
-            result = self.value == other.value
-        else:
-            result = self.value == other
-        return result
-    
-    def __ne__(self, other):
-        result = None
-        
-        if isinstance(other, self.__class__):
-            result = self.value != other.value
-        else:
-            result = self.value != other
-        return result
-    
-    def __lt__(self, other):
-        result = None
-        
-        if isinstance(other, self.__class__):
-            result = self.value < other.value
-        else:
-            result = self.value < other
-        return result        
-    
-    def __gt__(self, other):
-        result = None
-        
-        if isinstance(other, self.__class__):
-            result = self.value > other.value
-        else:
-            result = self.value > other
-        return result
-    
-    def __le__(self, other):
-        result = None
-        
-        if isinstance(other, self.__class__):
-            result = self.value <= other.value
-        else:
-            result = self.value <= other
-        return result
-    
-    def __ge__(self, other):
-        result = None
-        
-        if isinstance(other, self.__class__):
-            result = self.value >= other.value
-        else:
-            result = self.value >= other
-        return result
-        
-    def __add__(self, other):
-        result = None
-
-        if isinstance(other,  self.__class__):
-            try:
-                result = self.value + other.value
-            except TypeError, e:
-                raise e
-        else:
-            try:
-                result = self.value + other
-            except TypeError, e:
-                raise e
-        return result
-    
-    def __sub__(self, other):
-        result = None
-        if isinstance(other,  self.__class__):
-            try:
-                result = self.value - other.value
-            except TypeError, e:
-                raise e
-        else:
-            try:
-                result = self.value - other
-            except TypeError, e:
-                raise e
-        return result
-    
-    def __mul__(self, other):
-        result = None
-        if isinstance(other,  self.__class__):
-            result = self.value * other.value
-        else:
-            try:
-                result = self.value * other
-            except TypeError, e:
-                raise e
-        return result
-        
-    def __div__(self, other):
-        result = None
-        if isinstance(other,  self.__class__):
-            try:
-                result = self.value / other.value
-            except (TypeError, ZeroDivisionError) as e:
-                raise e
-        else:
-            try:
-                result = self.value / other
-            except (TypeError, ZeroDivisionError) as e:
-                raise e
-        return result
+    __getstate__ = _getState
+    __setstate__ = _setState
 
-    def __xor__(self, other):
-        result = None
-        if isinstance(other,  self.__class__):
-            result = self.value ^ other.value
-        else:
-            try:
-                result = self.value ^ other
-            except TypeError, e:
-                raise e
-        return result
-        
-    def __rshift__(self, other):
-        result = None
-        if isinstance(other,  self.__class__):
-            result = self.value >> other.value
-        else:
-            try:
-                result = self.value >> other
-            except TypeError, e:
-                raise e
-        return result
-        
-    def __lshift__(self, other):
-        result = None
-        if isinstance(other,  self.__class__):
-            result = self.value << other.value
-        else:
-            try:
-                result = self.value << other
-            except TypeError, e:
-                raise e
-        return result
-        
-    def __and__(self, other):
-        result = None
-        if isinstance(other,  self.__class__):
-            result = self.value & other.value
-        else:
-            try:
-                result = self.value & other
-            except TypeError, e:
-                raise e
-        return result
+    __eq__ = _binop(operator.eq)
+    __ne__ = _binop(operator.ne)
+    __lt__ = _binop(operator.lt)
+    __gt__ = _binop(operator.gt)
+    __le__ = _binop(operator.le)
+    __ge__ = _binop(operator.ge)
 
-    def __or__(self, other):
-        result = None
-        if isinstance(other,  self.__class__):
-            result = self.value | other.value
-        else:
-            try:
-                result = self.value | other
-            except TypeError, e:
-                raise e
-        return result
+    __add__ = _binop(operator.add)
+    __sub__ = _binop(operator.sub)
+    __mul__ = _binop(operator.mul)
+    __div__ = _binop(operator.div)
+    __xor__ = _binop(operator.xor)
+    __rshift__ = _binop(operator.rshift)
+    __lshift__ = _binop(operator.lshift)
+    __and__ = _binop(operator.and_)
+    __or__ = _binop(operator.or_)
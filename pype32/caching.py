@@ -40,7 +40,7 @@ class Cache(object):
         return self.cache.get(key)
 
     def put(self, key, value):
-        self.cache.update({ key: value })
+        self.cache[key] = value
 
 def getCache(name):
     cache = caches.get(name)
@@ -51,14 +51,18 @@ def getCache(name):
 
 def cached(*ids):
     def decorator(func):
+        # the cache is resolved once, when the function is decorated. Entries are keyed
+        # by the instance id plus the arguments, so different instances don't share results.
+        cache = getCache("#".join([func.__name__] + [str(_) for _ in ids])).cache
         def decorated(self, *args):
-            funcname = "#".join([func.__name__] + [str(_) for _ in ids])
-            cache = getCache(funcname)
-            key = hash(args)
-            result = cache.get(key)
-            if result is None:
+            key = (id(self),) + args
+            try:
+                return cache[key]
+            except KeyError:
                 result = func(self, *args)
-                cache.put(key, result)
-            return result
+                cache[key] = result
+                return result
+        decorated.__name__ = func.__name__
+        decorated.__doc__ = func.__doc__
         return decorated
     return decorator
@@ -41,9 +41,10 @@ __all__ = [
            
 import consts
 import excep
+import baseclasses
 import datatypes
 
-from struct import pack
+from struct import pack, unpack
 
 dirs = ["EXPORT_DIRECTORY","IMPORT_DIRECTORY","RESOURCE_DIRECTORY","EXCEPTION_DIRECTORY","SECURITY_DIRECTORY",\
 "RELOCATION_DIRECTORY","DEBUG_DIRECTORY","ARCHITECTURE_DIRECTORY","RESERVED_DIRECTORY","TLS_DIRECTORY",\
@@ -52,28 +53,35 @@ dirs = ["EXPORT_DIRECTORY","IMPORT_DIRECTORY","RESOURCE_DIRECTORY","EXCEPTION_DI
 
 class Directory(object):
     """Directory object."""
-    def __init__(self, shouldPack = True):
+    __slots__ = ("name", "rva", "size", "info", "shouldPack")
+    __getstate__ = baseclasses._getState
+    __setstate__ = baseclasses._setState
+
+    def __init__(self, shouldPack = True, name = None):
         """
         Class representation of the C{IMAGE_DATA_DIRECTORY} structure. 
         @see: U{http://msdn.microsoft.com/es-es/library/windows/desktop/ms680305%28v=vs.85%29.aspx}
         
         @type shouldPack: bool
         @param shouldPack: If set to C{True} the L{Directory} object will be packed. If set to C{False} the object won't be packed.
+        
+        @type name: L{String}
+        @param name: (Optional) The name of the directory. If not specified, an empty L{String} is used.
         """
-        self.name = datatypes.String("")
+        self.name = name if name is not None else datatypes.String("")
         self.rva = datatypes.DWORD(0) #: L{DWORD} rva.
         self.size = datatypes.DWORD(0) #: L{DWORD} size.
         self.info = None #: This variable holds the information of the directory.
         self.shouldPack = shouldPack
         
     def __str__(self):
-        return str(self.rva) + str(self.size)
+        return pack("<LL", self.rva.value, self.size.value)
 
     def __len__(self):
-        return len(str(self))
+        return 8
 
     def __dir__(self):
-        return sorted(self.__dict__.keys())
+        return sorted(self.__slots__)
         
     @staticmethod
     def parse(readDataInstance):
@@ -106,16 +114,10 @@ class DataDirectory(list):
         """
         self.shouldPack = shouldPack
         
-        for i in range(consts.IMAGE_NUMBEROF_DIRECTORY_ENTRIES):
-            dir = Directory()
-            dir.name.value = dirs[i]
-            self.append(dir)
+        list.__init__(self, [Directory(name = datatypes.String(name)) for name in dirs])
     
     def __str__(self):
-        packedRvasAndSizes = ""
-        for directory in self:
-            packedRvasAndSizes += str(directory)
-        return packedRvasAndSizes
+        return "".join([str(directory) for directory in self])
         
     @staticmethod
     def parse(readDataInstance):
@@ -131,10 +133,10 @@ class DataDirectory(list):
         """
         if len(readDataInstance) == consts.IMAGE_NUMBEROF_DIRECTORY_ENTRIES * 8:
             newDataDirectory = DataDirectory()
-            for i in range(consts.IMAGE_NUMBEROF_DIRECTORY_ENTRIES):
-                newDataDirectory[i].name.value = dirs[i]
-                newDataDirectory[i].rva.value = readDataInstance.readDword()
-                newDataDirectory[i].size.value = readDataInstance.readDword()
+            rvasAndSizes = unpack("<%dL" % (consts.IMAGE_NUMBEROF_DIRECTORY_ENTRIES * 2), readDataInstance.read(consts.IMAGE_NUMBEROF_DIRECTORY_ENTRIES * 8))
+            for directory, rva, size in zip(newDataDirectory, rvasAndSizes[0::2], rvasAndSizes[1::2]):
+                directory.rva.value = rva
+                directory.size.value = size
         else:
             raise excep.DirectoryEntriesLengthException("The IMAGE_NUMBEROF_DIRECTORY_ENTRIES does not match with the length of the passed argument.")
         return newDataDirectory
@@ -53,8 +53,8 @@ __all__ = [
 import utils
 import excep
 
-from baseclasses import DataTypeBaseClass
-from struct import pack,  unpack
+from baseclasses import DataTypeBaseClass, _getState, _setState
+from struct import Struct, pack, unpack_from
 
 TYPE_QWORD = 0xFECAFECA
 TYPE_DWORD = 0xDEADBEEF
@@ -64,8 +64,38 @@ TYPE_ARRAY = 0xFECA
 UNKNOWN_ARRAY_TYPE = 0xFFFF
 TYPE_STRING_HEAP_INDEX = 0x1000
 
+# null paddings used by AlignedString, keyed by alignment. The item at index i has i null bytes.
+_paddings = {}
+
+# compiled Struct objects used to pack the native types, keyed by (endianness, format character).
+_structs = {}
+
+def _getStruct(endianness, formatChar):
+    """
+    Returns a compiled C{struct.Struct} object for the given endianness and format character.
+    
+    @type endianness: str
+    @param endianness: The endianness used to pack the data. The C{<} indicates little-endian while C{>} indicates big-endian.
+    
+    @type formatChar: str
+    @param formatChar: The C{struct} format character of the data type.
+    
+    @rtype: Struct
+    @return: A C{struct.Struct} object for the C{endianness + formatChar} format.
+    """
+    key = (endianness, formatChar)
+    try:
+        return _structs[key]
+    except KeyError:
+        _structs[key] = Struct(endianness + formatChar)
+        return _structs[key]
+
 class String(object):
     """String object."""
+    __slots__ = ("value", "shouldPack")
+    __getstate__ = _getState
+    __setstate__ = _setState
+
     def __init__(self, value = "", shouldPack = True):
         """
         @type value: str
@@ -93,6 +123,8 @@ class String(object):
         
 class AlignedString(String):
     """Aligned string object."""
+    __slots__ = ("align",)
+
     def __init__(self, value, shouldPack = True, align = 4):
         """
         This object represent an aligned ASCII string.
@@ -109,7 +141,13 @@ class AlignedString(String):
         String.__init__(self,  value)
         
         self.align = align
-        self.value = value + "\x00" * (self.align - len(value) % self.align)
+        # the string is always null-terminated, so a value whose length is already a multiple
+        # of the alignment gets a whole block of padding (the same layout readAlignedString expects).
+        try:
+            paddings = _paddings[self.align]
+        except KeyError:
+            paddings = _paddings[self.align] = ["\x00" * i for i in range(self.align + 1)]
+        self.value = value + paddings[self.align - len(value) % self.align]
         self.shouldPack = shouldPack
         
 class Array(list):
@@ -129,10 +167,15 @@ class Array(list):
         self.arrayType = arrayType
         self.shouldPack = shouldPack
         
-        if not self.arrayType in [TYPE_BYTE,  TYPE_WORD,  TYPE_DWORD,  TYPE_QWORD]:
+        if self.arrayType not in _arrayTypes:
             raise TypeError("Couldn\'t create an Array of type %r" % self.arrayType)
             
     def __str__(self):
+        formats = set([(type(x), getattr(x, "endianness", None), getattr(x, "signed", None)) for x in self])
+        if len(formats) == 1:
+            itemType, endianness, signed = formats.pop()
+            if itemType is _arrayTypes[self.arrayType][2]:
+                return pack("%s%d%s" % (endianness, len(self), _arrayTypes[self.arrayType][1][signed]), *[x.value for x in self])
         return ''.join([str(x) for x in self])
 
     def sizeof(self):
@@ -159,41 +202,45 @@ class Array(list):
         @return: New L{Array} object.
         """
         newArray = Array(arrayType)
+        itemClass = _arrayTypes[arrayType][2]
+        newArray.extend([itemClass(value) for value in Array.parseValues(readDataInstance, arrayType, arrayLength)])
+        return newArray
+    
+    @staticmethod
+    def parseValues(readDataInstance, arrayType, arrayLength):
+        """
+        Reads the values of an array without building an L{Array} object. Use this when only the numbers
+        are needed, it doesn't create a L{BYTE}, L{WORD}, L{DWORD} or L{QWORD} object for every element.
+        
+        @type readDataInstance: L{ReadData}
+        @param readDataInstance: The L{ReadData} object containing the array data.
+        
+        @type arrayType: int
+        @param arrayType: The type of the elements. This value can be C{TYPE_BYTE}, C{TYPE_WORD}, C{TYPE_DWORD} or C{TYPE_QWORD}.
+        
+        @type arrayLength: int
+        @param arrayLength: The number of elements to read.
         
-        dataLength = len(readDataInstance)
-        
-        if arrayType is TYPE_DWORD:
-            toRead = arrayLength * 4
-            if dataLength >= toRead: 
-                for i in range(arrayLength):
-                    newArray.append(DWORD(readDataInstance.readDword()))
-            else:
-                raise excep.DataLengthException("Not enough bytes to read.")
-                
-        elif arrayType is TYPE_WORD:
-            toRead = arrayLength * 2
-            if dataLength >= toRead:
-                for i in range(arrayLength):
-                    newArray.append(DWORD(readDataInstance.readWord()))
-            else:
-                raise excep.DataLengthException("Not enough bytes to read.")
-                
-        elif arrayType is TYPE_QWORD:
-            toRead = arrayLength * 8
-            if dataLength >= toRead:
-                for i in range(arrayLength):
-                    newArray.append(QWORD(readDataInstance.readQword()))
-            else:
-                raise excep.DataLengthException("Not enough bytes to read.")
-                
-        elif arrayType is TYPE_BYTE:
-            for i in range(arrayLength):
-                newArray.append(BYTE(readDataInstance.readByte()))
-        
-        else:
+        @rtype: tuple
+        @return: A tuple with the integer values read from the L{ReadData} object.
+        
+        @raise ArrayTypeException: The array type is not supported.
+        @raise DataLengthException: There are not enough bytes to read C{arrayLength} elements.
+        """
+        try:
+            itemSize, formatChars = _arrayTypes[arrayType][:2]
+        except KeyError:
             raise excep.ArrayTypeException("Could\'t create an array of type %d" % arrayType)
-            
-        return newArray
+        
+        # like a range() of the same length, a negative length reads no elements.
+        arrayLength = max(arrayLength, 0)
+        toRead = arrayLength * itemSize
+        if len(readDataInstance) < toRead:
+            raise excep.DataLengthException("Not enough bytes to read.")
+        
+        values = unpack_from("%s%d%s" % (readDataInstance.endianness, arrayLength, formatChars[readDataInstance.signed]), readDataInstance.data, readDataInstance.offset)
+        readDataInstance.offset += toRead
+        return values
     
     def getType(self):
         """
@@ -203,14 +250,15 @@ class Array(list):
         
 class BYTE(DataTypeBaseClass):
     """Byte object."""
-    def __init__(self,  value = 0,  endianness = "<",  signed = False,  shouldPack = True):
-        DataTypeBaseClass.__init__(self, value, endianness, signed, shouldPack)        
-        
+    __slots__ = ()
+
+    _formatChars = "Bb"
+
     def __str__(self):
-        return pack(self.endianness  + ("b" if self.signed else "B"),  self.value)
+        return _getStruct(self.endianness, self._formatChars[self.signed]).pack(self.value)
         
     def __len__(self):
-        return len(str(self))
+        return 1
 
     def getType(self):
         """
@@ -239,14 +287,15 @@ class BYTE(DataTypeBaseClass):
         
 class WORD(DataTypeBaseClass):
     """Word object."""
-    def __init__(self,  value = 0,  endianness = "<",  signed = False,  shouldPack = True):
-        DataTypeBaseClass.__init__(self, value, endianness, signed, shouldPack)    
-        
+    __slots__ = ()
+
+    _formatChars = "Hh"
+
     def __str__(self):
-        return pack(self.endianness + ("h" if self.signed else "H"),  self.value)
+        return _getStruct(self.endianness, self._formatChars[self.signed]).pack(self.value)
     
     def __len__(self):
-        return len(str(self))
+        return 2
 
     def getType(self):
         """
@@ -273,14 +322,15 @@ class WORD(DataTypeBaseClass):
         
 class DWORD(DataTypeBaseClass):
     """Dword object."""
-    def __init__(self,  value = 0,  endianness = "<",  signed = False,  shouldPack = True):
-        DataTypeBaseClass.__init__(self, value, endianness, signed, shouldPack)    
-        
+    __slots__ = ()
+
+    _formatChars = "Ll"
+
     def __str__(self):
-        return pack(self.endianness  + ("l" if self.signed else "L"),  self.value)
+        return _getStruct(self.endianness, self._formatChars[self.signed]).pack(self.value)
     
     def __len__(self):
-        return len(str(self))
+        return 4
 
     def getType(self):
         """Returns L{TYPE_DWORD}."""
@@ -305,14 +355,15 @@ class DWORD(DataTypeBaseClass):
         
 class QWORD(DataTypeBaseClass):
     """Qword object."""
-    def __init__(self,  value = 0,  endianness = "<",  signed = False,  shouldPack = True):
-        DataTypeBaseClass.__init__(self, value, endianness, signed, shouldPack)        
-        
+    __slots__ = ()
+
+    _formatChars = "Qq"
+
     def __str__(self):
-        return pack(self.endianness + ("q" if self.signed else "Q"),  self.value)
+        return _getStruct(self.endianness, self._formatChars[self.signed]).pack(self.value)
         
     def __len__(self):
-        return len(str(self))
+        return 8
     
     def getType(self):
         """Returns L{TYPE_QWORD}."""
@@ -334,3 +385,11 @@ class QWORD(DataTypeBaseClass):
         @return: A new L{QWORD} object.
         """
         return QWORD(readDataInstance.readQword())
+
+# item size, struct format characters (unsigned, signed) and class of the elements for every Array type.
+_arrayTypes = {
+               TYPE_BYTE: (1, BYTE._formatChars, BYTE),
+               TYPE_WORD: (2, WORD._formatChars, WORD),
+               TYPE_DWORD: (4, DWORD._formatChars, DWORD),
+               TYPE_QWORD: (8, QWORD._formatChars, QWORD),
+              }
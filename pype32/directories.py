@@ -42,6 +42,171 @@ import utils
 import baseclasses
 import dotnet
 
+from struct import Struct, calcsize, pack, unpack_from
+from itertools import chain, izip, repeat
+
+# compiled layouts of the fixed-size structures.
+_boundEntryStruct = Struct("<LHH") # IMAGE_BOUND_FORWARDER_REF and IMAGE_BOUND_IMPORT_DESCRIPTOR
+_tlsDirectoryStruct = Struct("<6L")
+_tlsDirectory64Struct = Struct("<4Q2L")
+_debugDirectoryFields = "LLHHLLLL"
+_debugDirectoryStruct = Struct("<" + _debugDirectoryFields)
+_baseRelocationStruct = Struct("<2L")
+_importDescriptorFields = "LLLLL"
+_importDescriptorStruct = Struct("<" + _importDescriptorFields)
+_netMetaDataStreamStruct = Struct("<2L") # offset and size, the name is read apart
+_exportTableEntryStruct = Struct("<LHL") # functionRva, nameOrdinal and nameRva, the name is read apart
+_imageExportTableStruct = Struct("<2L2H7L")
+_netDirectoryStruct = Struct("<LHH16L") # IMAGE_COR20_HEADER
+_netMetaDataHeaderStruct = Struct("<LHHLL") # the fields before versionString
+_netMetaDataHeaderTailStruct = Struct("<HH") # the fields after versionString
+_netMetaDataTableHeaderStruct = Struct("<L4B2Q")
+_netResourcesReaderStruct = Struct("<2L") # readerCount and readerTypeLength, the reader type is read apart
+_netResourcesCountsStruct = Struct("<3L") # version, resourceCount and resourceTypeCount
+
+_nullBoundEntry = "\x00" * consts.SIZEOF_IMAGE_BOUND_IMPORT_ENTRY32
+
+# format characters of every field of the load config structures, in the same order as their _attrsList.
+_loadConfigDirectoryFields = "LLHH" + "L" * 10 + "HH" + "L" * 9
+_loadConfigDirectory64Fields = "LLHHLLL" + "Q" * 6 + "LHH" + "Q" * 9
+
+def _fieldsSetter(attrsList):
+    """
+    Builds a method that sets the values of all the given fields in a single assignment.
+    
+    The source of the method is generated once, when the class is created, so parsing a structure
+    doesn't need to look up its fields by name one at a time.
+    
+    @type attrsList: tuple
+    @param attrsList: The names of the fields, in the same order the values will be received.
+    
+    @rtype: function
+    @return: A function that receives the structure and a sequence of values, one per field.
+    """
+    source = "def setFields(self, values):\n    %s = values\n" % ", ".join(["self.%s.value" % attr for attr in attrsList])
+    namespace = {}
+    exec source in namespace
+    return namespace["setFields"]
+
+def _fieldsGetter(attrsList):
+    """
+    Builds a method that returns the values of all the given fields, the counterpart of L{_fieldsSetter}.
+    
+    @type attrsList: tuple
+    @param attrsList: The names of the fields, in the same order the values will be returned.
+    
+    @rtype: function
+    @return: A function that receives the structure and returns a tuple with the value of every field.
+    """
+    source = "def getValues(self):\n    return (%s,)\n" % ", ".join(["self.%s.value" % attr for attr in attrsList])
+    namespace = {}
+    exec source in namespace
+    return namespace["getValues"]
+
+def _packEntries(entries, fieldFormats):
+    """
+    Packs an array of fixed-size structures with a single C{struct} call, instead of packing every field on its own.
+    
+    @type entries: list
+    @param entries: The structures to pack. They must provide a C{_getValues} method built with L{_fieldsGetter}.
+    
+    @type fieldFormats: str
+    @param fieldFormats: The C{struct} format characters of the fields of a single structure.
+    
+    @rtype: str
+    @return: The packed entries whose C{shouldPack} attribute is set to C{True}.
+    """
+    # shouldPack is a plain attribute that callers may flip at any time, so the packable
+    # entries are picked here, in the same pass that collects their values.
+    values = [entry._getValues() for entry in entries if entry.shouldPack]
+    return pack("<" + fieldFormats * len(values), *chain.from_iterable(values))
+
+def _readLoadConfigFields(readDataInstance, fieldFormats):
+    """
+    Reads the fields of a load config structure that are covered by its C{size} field.
+    
+    The structure has grown over the years (the Control Flow Guard fields, for example, were added later),
+    so older binaries use only a prefix of it. The fields that don't fit in C{size} (or in the available data)
+    are not read and get a zero value.
+    
+    @type readDataInstance: L{ReadData}
+    @param readDataInstance: A L{ReadData} object positioned at the start of the structure.
+    
+    @type fieldFormats: str
+    @param fieldFormats: The C{struct} format characters of every field of the structure, starting with C{size}.
+    
+    @rtype: tuple
+    @return: One value per field of the structure.
+    """
+    size = min(unpack_from("<L", readDataInstance.data, readDataInstance.offset)[0], len(readDataInstance))
+    
+    # the size field itself is always read.
+    structFormat = "<" + fieldFormats[0]
+    for formatChar in fieldFormats[1:]:
+        if calcsize(structFormat + formatChar) > size:
+            break
+        structFormat += formatChar
+    
+    values = readDataInstance.readStruct(Struct(structFormat))
+    return values + (0,) * (len(fieldFormats) - len(values))
+
+def _readMetaDataTableRows(readDataInstance, fields, nRows):
+    """
+    Reads the rows of a .NET metadata table.
+    
+    Once the table header was read, every column has a fixed size, so the row format is compiled once
+    and every column is decoded at once. This gives the same rows as calling L{ReadData.readFields}
+    once per row.
+    
+    @type readDataInstance: L{ReadData}
+    @param readDataInstance: A L{ReadData} object positioned at the first row of the table.
+    
+    @type fields: list
+    @param fields: The definition of the table columns, as returned by L{dotnet.MetadataTableDefinitions}.
+    
+    @type nRows: int
+    @param nRows: The number of rows in the table.
+    
+    @rtype: list
+    @return: A list with one dictionary per row, mapping the column names to their values.
+    
+    @raise DataLengthException: If not enough data to read.
+    """
+    names = []
+    decoders = []
+    columnFormats = []
+    for field in fields:
+        name, column = field.iteritems().next()
+        names.append(name)
+        if isinstance(column, baseclasses.DataTypeBaseClass):
+            columnFormats.append(column._formatChars[readDataInstance.signed])
+            decoders.append(None)
+        else:
+            columnFormats.append(column.getFormat())
+            decoders.append(column.decodeColumn)
+    
+    rowStruct = Struct(readDataInstance.endianness + "".join(columnFormats))
+    rowSize = rowStruct.size
+    
+    # the row count comes straight from the file, so it is checked before anything is allocated for it.
+    if rowSize * nRows > len(readDataInstance):
+        raise excep.DataLengthException("Not enough bytes to read.")
+    
+    data = readDataInstance.data
+    offset = readDataInstance.offset
+    unpackRow = rowStruct.unpack_from
+    rows = [unpackRow(data, offset + i * rowSize) for i in xrange(nRows)]
+    readDataInstance.skipBytes(rowSize * nRows)
+    
+    columns = []
+    for decode, column in izip(decoders, izip(*rows)):
+        if decode is not None:
+            column = decode(column)
+        columns.append(column)
+    
+    # the rows are put together straight from the column iterators, without building a list of tuples first.
+    return [dict(izip(names, row)) for row in izip(*columns)]
+
 # typedef struct IMAGE_BOUND_FORWARDER_REF
 # {
 #    DWORD   TimeDateStamp;
@@ -50,6 +215,10 @@ import dotnet
 # }
 class ImageBoundForwarderRefEntry(baseclasses.BaseStructClass):
     """ImageBoundForwarderRefEntry object."""
+
+    _attrsList = ("timeDateStamp",  "offsetModuleName",  "reserved",  "moduleName")
+    __slots__ = _attrsList
+
     def __init__(self,  shouldPack = True):
         """
         This class represents an element of type C{IMAGE_BOUND_FORWARDER_REF}.
@@ -64,8 +233,6 @@ class ImageBoundForwarderRefEntry(baseclasses.BaseStructClass):
         self.offsetModuleName = datatypes.WORD(0) #: L{WORD} offsetModuleName.
         self.reserved = datatypes.WORD(0) #: L{WORD} reserved.
         self.moduleName = datatypes.String(shouldPack = False) #: moduleName is metadata, not part of the structure.
-        
-        self._attrsList = ["timeDateStamp",  "offsetModuleName",  "reserved",  "moduleName"]
     
     def getType(self):
         """Returns L{consts.IMAGE_BOUND_FORWARDER_REF_ENTRY}."""
@@ -83,13 +250,17 @@ class ImageBoundForwarderRefEntry(baseclasses.BaseStructClass):
         @return: A new L{ImageBoundForwarderRefEntry} object.
         """
         boundForwarderEntry = ImageBoundForwarderRefEntry()
-        boundForwarderEntry.timeDateStamp.value = readDataInstance.readDword()
-        boundForwarderEntry.offsetModuleName.value = readDataInstance.readWord()
-        boundForwarderEntry.reserved.value = readDataInstance.readWord()
+        boundForwarderEntry.timeDateStamp.value, boundForwarderEntry.offsetModuleName.value, \
+            boundForwarderEntry.reserved.value = readDataInstance.readStruct(_boundEntryStruct)
         return boundForwarderEntry
 
 class ImageBoundForwarderRef(list):
     """ImageBoundForwarderRef array object."""
+
+    __slots__ = ("shouldPack",)
+    __getstate__ = baseclasses._getState
+    __setstate__ = baseclasses._setState
+
     def __init__(self, shouldPack = True):
         """
         This class is a wrapper over an array of C{IMAGE_BOUND_FORWARDER_REF}.
@@ -121,14 +292,19 @@ class ImageBoundForwarderRef(list):
         """
         imageBoundForwarderRefsList = ImageBoundForwarderRef()
         dLength = len(readDataInstance)
-        entryLength = ImageBoundForwarderRefEntry().sizeof()
+        entryLength = consts.SIZEOF_IMAGE_BOUND_FORWARDER_REF_ENTRY32
         toRead = numberOfEntries * entryLength
         
         if dLength >= toRead:
-            for i in range(numberOfEntries):
-                entryData = readDataInstance.read(entryLength)
-                rd = utils.ReadData(entryData)
-                imageBoundForwarderRefsList.append(ImageBoundForwarderRefEntry.parse(rd))
+            values = unpack_from("<" + "LHH" * numberOfEntries, readDataInstance.data, readDataInstance.offset)
+            readDataInstance.offset += toRead
+            
+            for timeDateStamp, offsetModuleName, reserved in zip(values[0::3], values[1::3], values[2::3]):
+                boundForwarderEntry = ImageBoundForwarderRefEntry()
+                boundForwarderEntry.timeDateStamp.value = timeDateStamp
+                boundForwarderEntry.offsetModuleName.value = offsetModuleName
+                boundForwarderEntry.reserved.value = reserved
+                imageBoundForwarderRefsList.append(boundForwarderEntry)
         else:
             raise excep.DataLengthException("Not enough bytes to read.")
         
@@ -136,6 +312,11 @@ class ImageBoundForwarderRef(list):
 
 class ImageBoundImportDescriptor(list):
     """ImageBoundImportDescriptor object."""
+
+    __slots__ = ("shouldPack",)
+    __getstate__ = baseclasses._getState
+    __setstate__ = baseclasses._setState
+
     def __init__(self, shouldPack = True):
         """
         Array of L{ImageBoundImportDescriptorEntry} objects.
@@ -162,22 +343,17 @@ class ImageBoundImportDescriptor(list):
         """
         ibd = ImageBoundImportDescriptor()
         
-        entryData = readDataInstance.read(consts.SIZEOF_IMAGE_BOUND_IMPORT_ENTRY32)
-        readDataInstance.offset = 0
-        while not utils.allZero(entryData):
-            prevOffset = readDataInstance.offset
-            
-            boundEntry = ImageBoundImportDescriptorEntry.parse(readDataInstance)
-            
-            # if the parsed entry has numberOfModuleForwarderRefs we must adjust the value in the readDataInstance.offset field
-            # in order to point after the last ImageBoundForwarderRefEntry.
-            if boundEntry.numberOfModuleForwarderRefs.value:
-                readDataInstance.offset = prevOffset + (consts.SIZEOF_IMAGE_BOUND_FORWARDER_REF_ENTRY32 * boundEntry.numberOfModuleForwarderRefs.value)
-            else:
-                readDataInstance.offset = prevOffset
+        # ImageBoundImportDescriptorEntry.parse leaves the offset right after the descriptor and its forwarder refs,
+        # so the array is walked in a single forward pass. As in ImageImportDescriptor, the null descriptor that
+        # ends the array is kept as its last element. If the data ends before it, we stop there.
+        entryLength = consts.SIZEOF_IMAGE_BOUND_IMPORT_ENTRY32
+        while len(readDataInstance) >= entryLength:
+            offset = readDataInstance.offset
+            isNullEntry = readDataInstance.data[offset:offset + entryLength] == _nullBoundEntry
             
-            ibd.append(boundEntry)
-            entryData = readDataInstance.read(consts.SIZEOF_IMAGE_BOUND_IMPORT_ENTRY32)
+            ibd.append(ImageBoundImportDescriptorEntry.parse(readDataInstance))
+            if isNullEntry:
+                break
             
         return ibd
 
@@ -189,6 +365,10 @@ class ImageBoundImportDescriptor(list):
 # }
 class ImageBoundImportDescriptorEntry(baseclasses.BaseStructClass):
     """ImageBoundImportDescriptorEntry object."""
+
+    _attrsList = ("timeDateStamp",  "offsetModuleName",  "numberOfModuleForwarderRefs",  "forwarderRefsList",  "moduleName")
+    __slots__ = _attrsList
+
     def __init__(self,  shouldPack = True):
         """
         This class represents a C{IMAGE_BOUND_IMPORT_DESCRIPTOR} structure.
@@ -204,8 +384,6 @@ class ImageBoundImportDescriptorEntry(baseclasses.BaseStructClass):
         self.numberOfModuleForwarderRefs = datatypes.WORD(0)#: L{WORD} numberOfModuleForwarderRefs.
         self.forwarderRefsList = ImageBoundForwarderRef() #: L{ImageBoundForwarderRef} forwarderRefsList.
         self.moduleName = datatypes.String(shouldPack = False) #: moduleName is metadata, not part of the structure.
-        
-        self._attrsList = ["timeDateStamp",  "offsetModuleName",  "numberOfModuleForwarderRefs",  "forwarderRefsList",  "moduleName"]
     
     def getType(self):
         """Returns L{consts.IMAGE_BOUND_IMPORT_DESCRIPTOR_ENTRY}"""
@@ -223,20 +401,24 @@ class ImageBoundImportDescriptorEntry(baseclasses.BaseStructClass):
         @return: A new {ImageBoundImportDescriptorEntry} object.
         """
         boundEntry = ImageBoundImportDescriptorEntry()
-        boundEntry.timeDateStamp.value = readDataInstance.readDword()
-        boundEntry.offsetModuleName.value = readDataInstance.readWord()
-        boundEntry.numberOfModuleForwarderRefs.value = readDataInstance.readWord()
+        boundEntry.timeDateStamp.value, boundEntry.offsetModuleName.value, \
+            boundEntry.numberOfModuleForwarderRefs.value = readDataInstance.readStruct(_boundEntryStruct)
         
         numberOfForwarderRefsEntries = boundEntry.numberOfModuleForwarderRefs .value
         if numberOfForwarderRefsEntries:
-            bytesToRead = numberOfForwarderRefsEntries * ImageBoundForwarderRefEntry().sizeof()
-            rd = utils.ReadData(readDataInstance.read(bytesToRead))
-            boundEntry.forwarderRefsList = ImageBoundForwarderRef.parse(rd,  numberOfForwarderRefsEntries)
+            # the forwarder refs follow the descriptor, they are read in place from the same ReadData object.
+            boundEntry.forwarderRefsList = ImageBoundForwarderRef.parse(readDataInstance,  numberOfForwarderRefsEntries)
             
         return boundEntry
         
 class TLSDirectory(baseclasses.BaseStructClass):
     """TLS directory object."""
+
+    _attrsList = ("startAddressOfRawData", "endAddressOfRawData", "addressOfIndex", "addressOfCallbacks",\
+                  "sizeOfZeroFill", "characteristics")
+    __slots__ = _attrsList
+    _setFields = _fieldsSetter(_attrsList)
+
     def __init__(self, shouldPack = True):
         """
         Class representation of a C{IMAGE_TLS_DIRECTORY} structure.
@@ -254,9 +436,6 @@ class TLSDirectory(baseclasses.BaseStructClass):
         self.addressOfCallbacks = datatypes.DWORD(0) #: L{DWORD} addressOfCallbacks.
         self.sizeOfZeroFill = datatypes.DWORD(0) #: L{DWORD} sizeOfZeroFill.
         self.characteristics = datatypes.DWORD(0) #:L{DWORD} characteristics.
-        
-        self._attrsList = ["startAddressOfRawData", "endAddressOfRawData", "addressOfIndex", "addressOfCallbacks",\
-                           "sizeOfZeroFill", "characteristics"]
 
     def getType(self):
         """Returns L{consts.TLS_DIRECTORY}."""
@@ -275,16 +454,17 @@ class TLSDirectory(baseclasses.BaseStructClass):
         """
         tlsDir = TLSDirectory()
         
-        tlsDir.startAddressOfRawData.value = readDataInstance.readDword()
-        tlsDir.endAddressOfRawData.value = readDataInstance.readDword()
-        tlsDir.addressOfIndex.value = readDataInstance.readDword()
-        tlsDir.addressOfCallbacks.value = readDataInstance.readDword()
-        tlsDir.sizeOfZeroFill.value = readDataInstance.readDword()
-        tlsDir.characteristics.value = readDataInstance.readDword()
+        tlsDir._setFields(readDataInstance.readStruct(_tlsDirectoryStruct))
         return tlsDir
 
 class TLSDirectory64(baseclasses.BaseStructClass):
     """TLSDirectory64 object."""
+
+    _attrsList = ("startAddressOfRawData", "endAddressOfRawData", "addressOfIndex", "addressOfCallbacks",\
+                  "sizeOfZeroFill", "characteristics")
+    __slots__ = _attrsList
+    _setFields = _fieldsSetter(_attrsList)
+
     def __init__(self,  shouldPack = True):
         """
         Class representation of a C{IMAGE_TLS_DIRECTORY} structure in 64 bits systems.
@@ -300,9 +480,6 @@ class TLSDirectory64(baseclasses.BaseStructClass):
         self.addressOfCallbacks = datatypes.QWORD(0) #: L{QWORD} addressOfCallbacks.
         self.sizeOfZeroFill = datatypes.DWORD(0) #: L{DWORD} sizeOfZeroFill.
         self.characteristics = datatypes.DWORD(0) #: L{DWORD} characteristics.
-        
-        self._attrsList = ["startAddressOfRawData", "endAddressOfRawData", "addressOfIndex", "addressOfCallbacks",\
-                           "sizeOfZeroFill", "characteristics"]
 
     def getType(self):
         """Returns L{consts.TLS_DIRECTORY64}."""
@@ -321,17 +498,20 @@ class TLSDirectory64(baseclasses.BaseStructClass):
         """
         tlsDir = TLSDirectory64()
         
-        tlsDir.startAddressOfRawData.value = readDataInstance.readQword()
-        tlsDir.endAddressOfRawData.value = readDataInstance.readQword()
-        tlsDir.addressOfIndex.value = readDataInstance.readQword()
-        tlsDir.addressOfCallbacks.value = readDataInstance.readQword()
-        tlsDir.sizeOfZeroFill.value = readDataInstance.readDword()
-        tlsDir.characteristics.value = readDataInstance.readDword()
+        tlsDir._setFields(readDataInstance.readStruct(_tlsDirectory64Struct))
         return tlsDir
 
 # http://msdn.microsoft.com/en-us/library/windows/desktop/ms680328%28v=vs.85%29.aspx
 class ImageLoadConfigDirectory(baseclasses.BaseStructClass):
     "IMAGE_LOAD_CONFIG_DIRECTORY32 object aka CONFIGURATION_DIRECTORY"
+
+    _attrsList = ("size", "timeDateStamp", "majorVersion", "minorVersion", "globalFlagsClear", "globalFlagsSet", "criticalSectionDefaultTimeout", "deCommitFreeBlockThreshold",\
+                  "deCommitTotalFreeThreshold", "lockPrefixTable", "maximumAllocationSize", "virtualMemoryThreshold", "processHeapFlags", "processAffinityMask", "csdVersion",\
+                  "reserved1", "editList", "securityCookie", "SEHandlerTable","SEHandlerCount", "GuardCFCheckFunctionPointer", "Reserved2", "GuardCFFunctionTable",\
+                  "GuardCFFunctionCount", "GuardFlags")
+    __slots__ = _attrsList
+    _setFields = _fieldsSetter(_attrsList)
+
     def __init__(self, shouldPack = True):
         """
         Class representation of a C{IMAGE_LOAD_CONFIG_DIRECTORY32} structure.
@@ -369,11 +549,6 @@ class ImageLoadConfigDirectory(baseclasses.BaseStructClass):
         self.GuardCFFunctionCount = datatypes.DWORD()
         self.GuardFlags = datatypes.DWORD()
 
-        self._attrsList = ["size", "timeDateStamp", "majorVersion", "minorVersion", "globalFlagsClear", "globalFlagsSet", "criticalSectionDefaultTimeout", "deCommitFreeBlockThreshold",\
-                            "deCommitTotalFreeThreshold", "lockPrefixTable", "maximumAllocationSize", "virtualMemoryThreshold", "processHeapFlags", "processAffinityMask", "csdVersion",\
-                            "reserved1", "editList", "securityCookie", "SEHandlerTable","SEHandlerCount", "GuardCFCheckFunctionPointer", "Reserved2", "GuardCFFunctionTable",\
-                            "GuardCFFunctionCount", "GuardFlags"]
-
     def getType(self):
         """Returns L{consts.IMAGE_LOAD_CONFIG_DIRECTORY32}."""
         return consts.IMAGE_LOAD_CONFIG_DIRECTORY32
@@ -390,38 +565,20 @@ class ImageLoadConfigDirectory(baseclasses.BaseStructClass):
         @return: A new L{ImageLoadConfigDirectory} object.
         """
         configDir = ImageLoadConfigDirectory()
-
-        configDir.size.value = readDataInstance.readDword()
-        configDir.timeDateStamp.value = readDataInstance.readDword()
-        configDir.majorVersion.value = readDataInstance.readWord()
-        configDir.minorVersion.value = readDataInstance.readWord()
-        configDir.globalFlagsClear.value = readDataInstance.readDword()
-        configDir.globalFlagsSet.value = readDataInstance.readDword()
-        configDir.criticalSectionDefaultTimeout.value = readDataInstance.readDword()
-        configDir.deCommitFreeBlockThreshold.value = readDataInstance.readDword()
-        configDir.deCommitTotalFreeThreshold.value = readDataInstance.readDword()
-        configDir.lockPrefixTable.value = readDataInstance.readDword() # VA
-        configDir.maximumAllocationSize.value = readDataInstance.readDword()
-        configDir.virtualMemoryThreshold.value = readDataInstance.readDword()
-        configDir.processHeapFlags.value = readDataInstance.readDword()
-        configDir.processAffinityMask.value = readDataInstance.readDword()
-        configDir.csdVersion.value = readDataInstance.readWord()
-        configDir.reserved1.value = readDataInstance.readWord()
-        configDir.editList.value = readDataInstance.readDword() # VA
-        configDir.securityCookie.value = readDataInstance.readDword() # VA
-        configDir.SEHandlerTable.value = readDataInstance.readDword() # VA
-        configDir.SEHandlerCount.value = readDataInstance.readDword()
-
-        # Fields for Control Flow Guard
-        configDir.GuardCFCheckFunctionPointer.value = readDataInstance.readDword() # VA
-        configDir.Reserved2.value = readDataInstance.readDword()
-        configDir.GuardCFFunctionTable.value = readDataInstance.readDword() # VA
-        configDir.GuardCFFunctionCount.value = readDataInstance.readDword()
-        configDir.GuardFlags.value = readDataInstance.readDword()
+        
+        configDir._setFields(_readLoadConfigFields(readDataInstance, _loadConfigDirectoryFields))
         return configDir
 
 class ImageLoadConfigDirectory64(baseclasses.BaseStructClass):
     "IMAGE_LOAD_CONFIG_DIRECTORY64 object"
+
+    _attrsList = ("size", "timeDateStamp", "majorVersion", "minorVersion", "globalFlagsClear", "globalFlagsSet", "criticalSectionDefaultTimeout", "deCommitFreeBlockThreshold",\
+                  "deCommitTotalFreeThreshold", "lockPrefixTable", "maximumAllocationSize", "virtualMemoryThreshold", "processAffinityMask", "processHeapFlags", "cdsVersion",\
+                  "reserved1", "editList", "securityCookie", "SEHandlerTable", "SEHandlerCount", "GuardCFCheckFunctionPointer", "Reserved2", "GuardCFFunctionTable",\
+                  "GuardCFFunctionCount", "GuardFlags")
+    __slots__ = _attrsList
+    _setFields = _fieldsSetter(_attrsList)
+
     def __init__(self, shouldPack = True):
         """
         Class representation of a C{IMAGE_LOAD_CONFIG_DIRECTORY64} structure in 64 bits systems.
@@ -459,11 +616,6 @@ class ImageLoadConfigDirectory64(baseclasses.BaseStructClass):
         self.GuardCFFunctionCount = datatypes.QWORD()
         self.GuardFlags = datatypes.QWORD()
 
-        self._attrsList = ["size", "timeDateStamp", "majorVersion", "minorVersion", "globalFlagsClear", "globalFlagsSet", "criticalSectionDefaultTimeout", "deCommitFreeBlockThreshold",\
-                            "deCommitTotalFreeThreshold", "lockPrefixTable", "maximumAllocationSize", "virtualMemoryThreshold", "processAffinityMask", "processHeapFlags", "cdsVersion",\
-                            "reserved1", "editList", "securityCookie", "SEHandlerTable", "SEHandlerCount", "GuardCFCheckFunctionPointer", "Reserved2", "GuardCFFunctionTable",\
-                            "GuardCFFunctionCount", "GuardFlags"]
-
 
     def getType(self):
         """Returns L{consts.IMAGE_LOAD_CONFIG_DIRECTORY64}."""
@@ -481,38 +633,16 @@ class ImageLoadConfigDirectory64(baseclasses.BaseStructClass):
         @return: A new L{ImageLoadConfigDirectory64} object.
         """
         configDir = ImageLoadConfigDirectory64()
-
-        configDir.size.value = readDataInstance.readDword()
-        configDir.timeDateStamp.value = readDataInstance.readDword()
-        configDir.majorVersion.value = readDataInstance.readWord()
-        configDir.minorVersion.value = readDataInstance.readWord()
-        configDir.globalFlagsClear.value = readDataInstance.readDword()
-        configDir.globalFlagsSet.value = readDataInstance.readDword()
-        configDir.criticalSectionDefaultTimeout.value = readDataInstance.readDword()
-        configDir.deCommitFreeBlockThreshold.value = readDataInstance.readQword()
-        configDir.deCommitTotalFreeThreshold.value = readDataInstance.readQword()
-        configDir.lockPrefixTable.value = readDataInstance.readQword()
-        configDir.maximumAllocationSize.value = readDataInstance.readQword()
-        configDir.virtualMemoryThreshold.value = readDataInstance.readQword()
-        configDir.processAffinityMask.value = readDataInstance.readQword()
-        configDir.processHeapFlags.value = readDataInstance.readDword()
-        configDir.cdsVersion.value = readDataInstance.readWord()
-        configDir.reserved1.value = readDataInstance.readWord()
-        configDir.editList.value = readDataInstance.readQword()
-        configDir.securityCookie.value = readDataInstance.readQword()
-        configDir.SEHandlerTable.value = readDataInstance.readQword()
-        configDir.SEHandlerCount.value = readDataInstance.readQword()
-
-        # Fields for Control Flow Guard
-        configDir.GuardCFCheckFunctionPointer.value = readDataInstance.readQword() # VA
-        configDir.Reserved2.value = readDataInstance.readQword()
-        configDir.GuardCFFunctionTable.value = readDataInstance.readQword() # VA
-        configDir.GuardCFFunctionCount.value = readDataInstance.readQword()
-        configDir.GuardFlags.value = readDataInstance.readQword()
+        
+        configDir._setFields(_readLoadConfigFields(readDataInstance, _loadConfigDirectory64Fields))
         return configDir
 
 class ImageBaseRelocationEntry(baseclasses.BaseStructClass):
     """ImageBaseRelocationEntry object."""
+
+    _attrsList = ("virtualAddress", "sizeOfBlock", "items")
+    __slots__ = _attrsList
+
     def __init__(self,  shouldPack = True):
         """
         A class representation of a C{IMAGE_BASE_RELOCATION} structure.
@@ -526,8 +656,6 @@ class ImageBaseRelocationEntry(baseclasses.BaseStructClass):
         self.virtualAddress = datatypes.DWORD(0) #: L{DWORD} virtualAddress.
         self.sizeOfBlock = datatypes.DWORD(0) #: L{DWORD} sizeOfBlock
         self.items = datatypes.Array(datatypes.TYPE_WORD) #: L{Array} items.
-        
-        self._attrsList = ["virtualAddress", "sizeOfBlock", "items"]
     
     def getType(self):
         """Returns L{consts.IMAGE_BASE_RELOCATION_ENTRY}."""
@@ -545,18 +673,47 @@ class ImageBaseRelocationEntry(baseclasses.BaseStructClass):
         @return: A new L{ImageBaseRelocationEntry} object.
         """
         reloc = ImageBaseRelocationEntry()
-        reloc.virtualAddress.value = readDataInstance.readDword()
-        reloc.sizeOfBlock.value = readDataInstance.readDword()
-        toRead = (reloc.sizeOfBlock.value - 8) / len(datatypes.WORD(0))
+        reloc.virtualAddress.value, reloc.sizeOfBlock.value = readDataInstance.readStruct(_baseRelocationStruct)
+        # every item is a WORD that follows the 8 bytes of the block header.
+        toRead = (reloc.sizeOfBlock.value - 8) // 2
         reloc.items = datatypes.Array.parse(readDataInstance,  datatypes.TYPE_WORD,  toRead)
         return reloc
         
 class ImageBaseRelocation(list):
     """ImageBaseRelocation array."""
-    pass
+    
+    @staticmethod
+    def parse(readDataInstance, size):
+        """
+        Returns a new L{ImageBaseRelocation} object.
+        
+        @type readDataInstance: L{ReadData}
+        @param readDataInstance: A L{ReadData} object with data to be parsed as a L{ImageBaseRelocation} object.
+        
+        @type size: int
+        @param size: The size of the relocation directory.
+        
+        @rtype: L{ImageBaseRelocation}
+        @return: A new L{ImageBaseRelocation} object.
+        """
+        relocsArray = ImageBaseRelocation()
+        
+        # the relocation blocks are stored one after the other, each header followed by its items.
+        parseBlock = ImageBaseRelocationEntry.parse
+        appendBlock = relocsArray.append
+        while readDataInstance.offset < size:
+            appendBlock(parseBlock(readDataInstance))
+        return relocsArray
     
 class ImageDebugDirectory(baseclasses.BaseStructClass):
     """ImageDebugDirectory object."""
+
+    _attrsList = ("characteristics",  "timeDateStamp",  "majorVersion",  "minorVersion",  "type",  "sizeOfData",\
+                  "addressOfData",  "pointerToRawData")
+    __slots__ = _attrsList
+    _setFields = _fieldsSetter(_attrsList)
+    _getValues = _fieldsGetter(_attrsList)
+
     def __init__(self,  shouldPack = True):
         """
         Class representation of a C{IMAGE_DEBUG_DIRECTORY} structure.
@@ -575,9 +732,6 @@ class ImageDebugDirectory(baseclasses.BaseStructClass):
         self.sizeOfData = datatypes.DWORD(0) #: L{DWORD} sizeOfData.
         self.addressOfData = datatypes.DWORD(0) #: L{DWORD} addressOfData.
         self.pointerToRawData = datatypes.DWORD(0) #: L{DWORD} pointerToRawData.
-        
-        self._attrsList = ["characteristics",  "timeDateStamp",  "majorVersion",  "minorVersion",  "type",  "sizeOfData",\
-                           "addressOfData",  "pointerToRawData"]
     
     def getType(self):
         """Returns L{consts.IMAGE_DEBUG_DIRECTORY}."""
@@ -596,19 +750,17 @@ class ImageDebugDirectory(baseclasses.BaseStructClass):
         """
         dbgDir = ImageDebugDirectory()
 
-        dbgDir.characteristics.value = readDataInstance.readDword()
-        dbgDir.timeDateStamp.value = readDataInstance.readDword()
-        dbgDir.majorVersion.value = readDataInstance.readWord()
-        dbgDir.minorVersion.value = readDataInstance.readWord()
-        dbgDir.type.value = readDataInstance.readDword()
-        dbgDir.sizeOfData.value = readDataInstance.readDword()
-        dbgDir.addressOfData.value = readDataInstance.readDword()
-        dbgDir.pointerToRawData.value = readDataInstance.readDword()
+        dbgDir._setFields(readDataInstance.readStruct(_debugDirectoryStruct))
         
         return dbgDir
 
 class ImageDebugDirectories(list):
     """ImageDebugDirectories object."""
+
+    __slots__ = ("shouldPack",)
+    __getstate__ = baseclasses._getState
+    __setstate__ = baseclasses._setState
+
     def __init__(self,  shouldPack = True):
         """
         Array of L{ImageDebugDirectory} objects.
@@ -619,7 +771,7 @@ class ImageDebugDirectories(list):
         self.shouldPack = shouldPack
         
     def __str__(self):
-        return ''.join([str(x) for x in self if self.shouldPack])
+        return _packEntries(self, _debugDirectoryFields)
     
     def getType(self):
         """"Returns L{consts.IMAGE_DEBUG_DIRECTORIES}."""
@@ -646,9 +798,13 @@ class ImageDebugDirectories(list):
         dataLength = len(readDataInstance)
         toRead = nDebugEntries * consts.SIZEOF_IMAGE_DEBUG_ENTRY32
         if dataLength >= toRead:
-            for i in range(nDebugEntries):
-                dbgEntry = ImageDebugDirectory.parse(readDataInstance)
-                dbgEntries.append(dbgEntry)
+            values = unpack_from("<" + _debugDirectoryFields * nDebugEntries, readDataInstance.data, readDataInstance.offset)
+            readDataInstance.offset += toRead
+            
+            fieldsCount = len(ImageDebugDirectory._attrsList)
+            dbgEntries[:] = [ImageDebugDirectory() for _ in repeat(None, nDebugEntries)]
+            for i, dbgEntry in enumerate(dbgEntries):
+                dbgEntry._setFields(values[i * fieldsCount:(i + 1) * fieldsCount])
         else:
             raise excep.DataLengthException("Not enough bytes to read.")
         
@@ -656,6 +812,10 @@ class ImageDebugDirectories(list):
         
 class ImageImportDescriptorMetaData(baseclasses.BaseStructClass):
     """ImageImportDescriptorMetaData object."""
+
+    _attrsList = ("moduleName", "numberOfImports")
+    __slots__ = _attrsList
+
     def __init__(self,  shouldPack = True):
         """
         Class used to store metadata from the L{ImageImportDescriptor} object.
@@ -667,8 +827,6 @@ class ImageImportDescriptorMetaData(baseclasses.BaseStructClass):
         
         self.moduleName = datatypes.String("") #: L{String} moduleName.
         self.numberOfImports = datatypes.DWORD(0) #: L{DWORD} numberOfImports.
-        
-        self._attrsList = ["moduleName", "numberOfImports"]
     
     def getType(self):
         """Returns L{consts.IID_METADATA}."""
@@ -676,6 +834,12 @@ class ImageImportDescriptorMetaData(baseclasses.BaseStructClass):
         
 class ImageImportDescriptorEntry(baseclasses.BaseStructClass):
     """ImageImportDescriptorEntry object."""
+
+    _attrsList = ("originalFirstThunk", "timeDateStamp",  "forwarderChain",  "name",  "firstThunk")
+    __slots__ = _attrsList + ("metaData", "iat")
+    _setFields = _fieldsSetter(_attrsList)
+    _getValues = _fieldsGetter(_attrsList)
+
     def __init__(self, shouldPack = True):
         """
         Class representation of a C{IMAGE_IMPORT_DESCRIPTOR} structure.
@@ -696,8 +860,6 @@ class ImageImportDescriptorEntry(baseclasses.BaseStructClass):
         
         self.iat = ImportAddressTable() #: L{ImportAddressTable} iat.
         
-        self._attrsList = ["originalFirstThunk", "timeDateStamp",  "forwarderChain",  "name",  "firstThunk"]
-        
     @staticmethod
     def parse(readDataInstance):
         """
@@ -710,11 +872,7 @@ class ImageImportDescriptorEntry(baseclasses.BaseStructClass):
         @return: A new L{ImageImportDescriptorEntry} object.
         """
         iid = ImageImportDescriptorEntry()
-        iid.originalFirstThunk.value = readDataInstance.readDword()
-        iid.timeDateStamp.value = readDataInstance.readDword()
-        iid.forwarderChain.value = readDataInstance.readDword()
-        iid.name.value = readDataInstance.readDword()
-        iid.firstThunk.value = readDataInstance.readDword()
+        iid._setFields(readDataInstance.readStruct(_importDescriptorStruct))
         return iid
 
     def getType(self):
@@ -723,6 +881,11 @@ class ImageImportDescriptorEntry(baseclasses.BaseStructClass):
 
 class ImageImportDescriptor(list):
     """ImageImportDescriptor object."""
+
+    __slots__ = ("shouldPack",)
+    __getstate__ = baseclasses._getState
+    __setstate__ = baseclasses._setState
+
     def __init__(self, shouldPack = True):
         """
         Array of L{ImageImportDescriptorEntry} objects.
@@ -733,7 +896,7 @@ class ImageImportDescriptor(list):
         self.shouldPack = shouldPack
         
     def __str__(self):
-        return ''.join([str(x) for x in self if x.shouldPack])
+        return _packEntries(self, _importDescriptorFields)
     
     def getType(self):
         """Returns L{consts.IMAGE_IMPORT_DESCRIPTOR}."""
@@ -760,9 +923,13 @@ class ImageImportDescriptor(list):
         dataLength = len(readDataInstance)
         toRead = nEntries * consts.SIZEOF_IMAGE_IMPORT_ENTRY32
         if dataLength >= toRead:
-            for i in range(nEntries):
-                importEntry = ImageImportDescriptorEntry.parse(readDataInstance)
-                importEntries.append(importEntry)
+            values = unpack_from("<" + _importDescriptorFields * nEntries, readDataInstance.data, readDataInstance.offset)
+            readDataInstance.offset += toRead
+            
+            fieldsCount = len(ImageImportDescriptorEntry._attrsList)
+            importEntries[:] = [ImageImportDescriptorEntry() for _ in repeat(None, nEntries)]
+            for i, importEntry in enumerate(importEntries):
+                importEntry._setFields(values[i * fieldsCount:(i + 1) * fieldsCount])
         else:
             raise excep.DataLengthException("Not enough bytes to read.")
             
@@ -770,6 +937,10 @@ class ImageImportDescriptor(list):
 
 class ImportAddressTableEntry(baseclasses.BaseStructClass):
     """ImportAddressTableEntry object."""
+
+    _attrsList = ("firstThunk",  "originalFirstThunk",  "hint",  "name")
+    __slots__ = _attrsList
+
     def __init__(self,  shouldPack = True):
         """
         A class representation of a C{} structure.
@@ -784,14 +955,16 @@ class ImportAddressTableEntry(baseclasses.BaseStructClass):
         self.hint = datatypes.WORD(0) #: L{WORD} hint.
         self.name = datatypes.String("") #: L{String} name.
         
-        self._attrsList = ["firstThunk",  "originalFirstThunk",  "hint",  "name"]
-        
     def getType(self):
         """Returns L{consts.IMPORT_ADDRESS_TABLE_ENTRY}."""
         return consts.IMPORT_ADDRESS_TABLE_ENTRY
 
 class ImportAddressTableEntry64(baseclasses.BaseStructClass):
     """ImportAddressTableEntry64 object."""
+
+    _attrsList = ("firstThunk",  "originalFirstThunk",  "hint",  "name")
+    __slots__ = _attrsList
+
     def __init__(self,  shouldPack = True):
         """
         A class representation of a C{} structure.
@@ -806,22 +979,133 @@ class ImportAddressTableEntry64(baseclasses.BaseStructClass):
         self.hint = datatypes.WORD(0) #: L{WORD} hint.
         self.name = datatypes.String("") #: L{String} name.
         
-        self._attrsList = ["firstThunk",  "originalFirstThunk",  "hint",  "name"]
-        
     def getType(self):
         """Returns L{consts.IMPORT_ADDRESS_TABLE_ENTRY64}."""
         return consts.IMPORT_ADDRESS_TABLE_ENTRY64
 
-class ImportAddressTable(list):
+def _dropIndexes(method):
+    """
+    Wraps a C{list} method that changes the entries of an L{_IndexedEntries} object so its indexes are dropped.
+    
+    @type method: function
+    @param method: The C{list} method to wrap.
+    
+    @rtype: function
+    @return: A method that drops the indexes and then calls C{method}.
+    """
+    def f(self, *args):
+        self._indexes = None
+        return method(self, *args)
+    f.__name__ = method.__name__
+    return f
+
+class _IndexedEntries(list):
+    """
+    Base class for arrays of entries that can be looked up by the value of one of their fields.
+    
+    The index of a field is built the first time it is needed and dropped whenever the list is changed.
+    If an entry is modified in place, call L{reindex} before looking it up by its new value.
+    """
+
+    __slots__ = ("_indexes",)
+    __getstate__ = baseclasses._getState
+    __setstate__ = baseclasses._setState
+
+    append = _dropIndexes(list.append)
+    extend = _dropIndexes(list.extend)
+    insert = _dropIndexes(list.insert)
+    remove = _dropIndexes(list.remove)
+    pop = _dropIndexes(list.pop)
+    sort = _dropIndexes(list.sort)
+    reverse = _dropIndexes(list.reverse)
+    __setitem__ = _dropIndexes(list.__setitem__)
+    __delitem__ = _dropIndexes(list.__delitem__)
+    __setslice__ = _dropIndexes(list.__setslice__)
+    __delslice__ = _dropIndexes(list.__delslice__)
+    __iadd__ = _dropIndexes(list.__iadd__)
+    __imul__ = _dropIndexes(list.__imul__)
+
+    def _lookup(self, field, value):
+        """
+        Returns the first entry whose C{field} has the given value.
+        
+        @type field: str
+        @param field: The name of the field to look up.
+        
+        @type value: int or str
+        @param value: The value of the field.
+        
+        @rtype: object
+        @return: The first entry with that value or C{None} if there is none.
+        """
+        indexes = getattr(self, "_indexes", None)
+        if indexes is None:
+            indexes = self._indexes = {}
+        index = indexes.get(field)
+        if index is None:
+            index = indexes[field] = {}
+            for entry in self:
+                index.setdefault(getattr(entry, field).value, entry)
+        return index.get(value)
+
+    def reindex(self):
+        """Drops the indexes used by the lookup methods, they will be rebuilt from the current entries."""
+        self._indexes = None
+
+class ImportAddressTable(_IndexedEntries):
     """Array of L{ImportAddressTableEntry} objects."""
-    pass
 
-class ExportTable(list):
+    __slots__ = ()
+
+    def getByName(self, name):
+        """
+        Returns the entry of an imported function.
+        
+        @type name: str
+        @param name: The name of the imported function.
+        
+        @rtype: L{ImportAddressTableEntry}
+        @return: The entry of the function or C{None} if it is not imported by name.
+        """
+        return self._lookup("name", name)
+
+class ExportTable(_IndexedEntries):
     """Array of L{ExportTableEntry} objects."""
-    pass
+
+    __slots__ = ()
+
+    def getByOrdinal(self, ordinal):
+        """
+        Returns the entry of an exported function.
+        
+        @type ordinal: int
+        @param ordinal: The ordinal of the exported function.
+        
+        @rtype: L{ExportTableEntry}
+        @return: The entry of the function or C{None} if there is no export with that ordinal.
+        """
+        return self._lookup("ordinal", ordinal)
+
+    def getByName(self, name):
+        """
+        Returns the entry of an exported function.
+        
+        @type name: str
+        @param name: The name of the exported function.
+        
+        @rtype: L{ExportTableEntry}
+        @return: The entry of the function or C{None} if it is not exported by name.
+        """
+        return self._lookup("name", name)
     
 class ExportTableEntry(baseclasses.BaseStructClass):
     """ExportTableEntry object."""
+
+    _attrsList = ("ordinal", "functionRva",  "nameOrdinal",  "nameRva",  "name")
+    # there is one of these for every exported function, so their fields are kept in slots.
+    __slots__ = _attrsList
+    _setFields = _fieldsSetter(_attrsList)
+
     def __init__(self,  shouldPack = True):
         """
         A class representation of a C{} structure.
@@ -836,8 +1120,6 @@ class ExportTableEntry(baseclasses.BaseStructClass):
         self.nameOrdinal = datatypes.WORD(0) #: L{WORD} nameOrdinal.
         self.nameRva = datatypes.DWORD(0) #: L{DWORD} nameRva.
         self.name = datatypes.String("") #: L{String} name.
-        
-        self._attrsList = ["ordinal", "functionRva",  "nameOrdinal",  "nameRva",  "name"]
     
     def __repr__(self):
         return repr((self.ordinal,  self.functionRva,  self.nameOrdinal,  self.nameRva,  self.name))
@@ -859,14 +1141,18 @@ class ExportTableEntry(baseclasses.BaseStructClass):
         """
         exportEntry = ExportTableEntry()
 
-        exportEntry.functionRva.value = readDataInstance.readDword()
-        exportEntry.nameOrdinal.value = readDataInstance.readWord()
-        exportEntry.nameRva.value = readDataInstance.readDword()
+        exportEntry.functionRva.value, exportEntry.nameOrdinal.value, exportEntry.nameRva.value = readDataInstance.readStruct(_exportTableEntryStruct)
         exportEntry.name.value = readDataInstance.readString()
         return exportEntry
         
 class ImageExportTable(baseclasses.BaseStructClass):
     """ImageExportTable object."""
+
+    _attrsList = ("characteristics",  "timeDateStamp",  "majorVersion",  "minorVersion", "name",  "base",  "numberOfFunctions",\
+                  "numberOfNames",  "addressOfFunctions",  "addressOfNames",  "addressOfNameOrdinals")
+    __slots__ = _attrsList + ("exportTable",)
+    _setFields = _fieldsSetter(_attrsList)
+
     def __init__(self,  shouldPack = True):
         """
         Class representation of a C{IMAGE_EXPORT_DIRECTORY} structure.
@@ -890,9 +1176,6 @@ class ImageExportTable(baseclasses.BaseStructClass):
         self.addressOfFunctions = datatypes.DWORD(0) #: L{DWORD} addressOfFunctions.
         self.addressOfNames = datatypes.DWORD(0) #: L{DWORD} addressOfNames.
         self.addressOfNameOrdinals = datatypes.DWORD(0) #: L{DWORD} addressOfNamesOrdinals.
-        
-        self._attrsList = ["characteristics",  "timeDateStamp",  "majorVersion",  "minorVersion", "name",  "base",  "numberOfFunctions",\
-                           "numberOfNames",  "addressOfFunctions",  "addressOfNames",  "addressOfNameOrdinals"]
 
     def getType(self):
         """Returns L{consts.EXPORT_DIRECTORY}."""
@@ -911,21 +1194,15 @@ class ImageExportTable(baseclasses.BaseStructClass):
         """
         et = ImageExportTable()
         
-        et.characteristics.value = readDataInstance.readDword()
-        et.timeDateStamp.value = readDataInstance.readDword()
-        et.majorVersion.value = readDataInstance.readWord()
-        et.minorVersion.value = readDataInstance.readWord()
-        et.name.value = readDataInstance.readDword()
-        et.base.value = readDataInstance.readDword()
-        et.numberOfFunctions.value = readDataInstance.readDword()
-        et.numberOfNames.value = readDataInstance.readDword()
-        et.addressOfFunctions.value = readDataInstance.readDword()
-        et.addressOfNames.value = readDataInstance.readDword()
-        et.addressOfNameOrdinals.value = readDataInstance.readDword()
+        et._setFields(readDataInstance.readStruct(_imageExportTableStruct))
         return et
         
 class NETDirectory(baseclasses.BaseStructClass):
     """NETDirectory object."""
+
+    _attrsList = ("directory",  "netMetaDataHeader",  "netMetaDataStreams")
+    __slots__ = _attrsList
+
     def __init__(self,  shouldPack = True):
         """
         A class to abstract data from the .NET PE format.
@@ -938,8 +1215,6 @@ class NETDirectory(baseclasses.BaseStructClass):
         self.directory = NetDirectory() #: L{NetDirectory} directory.
         self.netMetaDataHeader = NetMetaDataHeader() #: L{NetMetaDataHeader} netMetaDataHeader.
         self.netMetaDataStreams = NetMetaDataStreams() #: L{NetMetaDataStreams} netMetaDataStreams.
-    
-        self._attrsList = ["directory",  "netMetaDataHeader",  "netMetaDataStreams"]
         
     @staticmethod
     def parse(readDataInstance):
@@ -965,6 +1240,13 @@ class NETDirectory(baseclasses.BaseStructClass):
         
 class NetDirectory(baseclasses.BaseStructClass):
     """NetDirectory object."""
+
+    _attrsList = ("cb","majorRuntimeVersion","minorRuntimeVersion","metaData", \
+                  "flags","entryPointToken","resources","strongNameSignature",\
+                  "codeManagerTable","vTableFixups", "exportAddressTableJumps",\
+                  "managedNativeHeader")
+    __slots__ = _attrsList
+
     def __init__(self,  shouldPack = True):
         """
         A class representation of the C{IMAGE_COR20_HEADER} structure.
@@ -988,11 +1270,6 @@ class NetDirectory(baseclasses.BaseStructClass):
         self.exportAddressTableJumps = datadirs.Directory() #: L{Directory} exportAddressTableJumps.
         self.managedNativeHeader = datadirs.Directory() #: L{Directory} managedNativeHeader.
         
-        self._attrsList = ["cb","majorRuntimeVersion","minorRuntimeVersion","metaData", \
-        "flags","entryPointToken","resources","strongNameSignature",\
-        "codeManagerTable","vTableFixups", "exportAddressTableJumps",\
-        "managedNativeHeader"]
-        
     def getType(self):
         """Returns L{consts.IMAGE_COR20_HEADER}."""
         return consts.IMAGE_COR20_HEADER
@@ -1010,45 +1287,32 @@ class NetDirectory(baseclasses.BaseStructClass):
         """
         nd = NetDirectory()
         
-        nd.cb.value = readDataInstance.readDword()
-        nd.majorRuntimeVersion.value= readDataInstance.readWord()
-        nd.minorRuntimeVersion.value = readDataInstance.readWord()
+        (nd.cb.value, nd.majorRuntimeVersion.value, nd.minorRuntimeVersion.value,
+         nd.metaData.rva.value, nd.metaData.size.value,
+         nd.flags.value, nd.entryPointToken.value,
+         nd.resources.rva.value, nd.resources.size.value,
+         nd.strongNameSignature.rva.value, nd.strongNameSignature.size.value,
+         nd.codeManagerTable.rva.value, nd.codeManagerTable.size.value,
+         nd.vTableFixups.rva.value, nd.vTableFixups.size.value,
+         nd.exportAddressTableJumps.rva.value, nd.exportAddressTableJumps.size.value,
+         nd.managedNativeHeader.rva.value, nd.managedNativeHeader.size.value) = readDataInstance.readStruct(_netDirectoryStruct)
         
-        nd.metaData.rva.value = readDataInstance.readDword()
-        nd.metaData.size.value = readDataInstance.readDword()
         nd.metaData.name.value = "MetaData"
-        
-        nd.flags.value = readDataInstance.readDword()
-        nd.entryPointToken.value = readDataInstance.readDword()
-        
-        nd.resources.rva.value = readDataInstance.readDword()
-        nd.resources.size.value = readDataInstance.readDword()
         nd.resources.name.value = "Resources"
-        
-        nd.strongNameSignature.rva.value = readDataInstance.readDword()
-        nd.strongNameSignature.size.value = readDataInstance.readDword()
         nd.strongNameSignature.name.value = "StrongNameSignature"
-        
-        nd.codeManagerTable.rva.value = readDataInstance.readDword()
-        nd.codeManagerTable.size.value = readDataInstance.readDword()
         nd.codeManagerTable.name.value = "CodeManagerTable"
-        
-        nd.vTableFixups.rva.value = readDataInstance.readDword()
-        nd.vTableFixups.size.value = readDataInstance.readDword()
         nd.vTableFixups.name.value = "VTableFixups"
-        
-        nd.exportAddressTableJumps.rva.value = readDataInstance.readDword()
-        nd.exportAddressTableJumps.size.value = readDataInstance.readDword()
         nd.exportAddressTableJumps.name.value = "ExportAddressTableJumps"
-        
-        nd.managedNativeHeader.rva.value = readDataInstance.readDword()
-        nd.managedNativeHeader.size.value = readDataInstance.readDword()
         nd.managedNativeHeader.name.value = "ManagedNativeHeader"
         
         return nd
         
 class NetMetaDataHeader(baseclasses.BaseStructClass):
     """NetMetaDataHeader object."""
+
+    _attrsList = ("signature","majorVersion","minorVersion","reserved","versionLength","versionString","flags","numberOfStreams")
+    __slots__ = _attrsList
+
     def __init__(self,  shouldPack = True):
         baseclasses.BaseStructClass.__init__(self,  shouldPack)
         
@@ -1061,8 +1325,6 @@ class NetMetaDataHeader(baseclasses.BaseStructClass):
         self.flags = datatypes.WORD(0) #: L{WORD} flags.
         self.numberOfStreams = datatypes.WORD(0) #: L{WORD} numberOfStreams.
         
-        self._attrsList = ["signature","majorVersion","minorVersion","reserved","versionLength","versionString","flags","numberOfStreams"]
-        
     def getType(self):
         """Returns L{consts.NET_METADATA_HEADER}."""
         return consts.NET_METADATA_HEADER
@@ -1080,18 +1342,17 @@ class NetMetaDataHeader(baseclasses.BaseStructClass):
         """
         nmh = NetMetaDataHeader()
         
-        nmh.signature.value = readDataInstance.readDword()
-        nmh.majorVersion.value = readDataInstance.readWord()
-        nmh.minorVersion.value = readDataInstance.readWord()
-        nmh.reserved.value = readDataInstance.readDword()
-        nmh.versionLength.value = readDataInstance.readDword()
+        nmh.signature.value, nmh.majorVersion.value, nmh.minorVersion.value, nmh.reserved.value, nmh.versionLength.value = readDataInstance.readStruct(_netMetaDataHeaderStruct)
         nmh.versionString.value = readDataInstance.readAlignedString()
-        nmh.flags.value = readDataInstance.readWord()
-        nmh.numberOfStreams.value = readDataInstance.readWord()
+        nmh.flags.value, nmh.numberOfStreams.value = readDataInstance.readStruct(_netMetaDataHeaderTailStruct)
         return nmh
 
 class NetMetaDataStreamEntry(baseclasses.BaseStructClass):
     """NetMetaDataStreamEntry object."""
+
+    _attrsList = ("offset",  "size",  "name",  "info")
+    __slots__ = _attrsList + ("_lookup",)
+
     def __init__(self,  shouldPack = True):
         baseclasses.BaseStructClass.__init__(self,  shouldPack)
         
@@ -1102,8 +1363,45 @@ class NetMetaDataStreamEntry(baseclasses.BaseStructClass):
         # the "info" attribute does not belong to the NETMetaDataStreamEntry struct. It is just a place holder where the
         # data for every entry will be stored.
         self.info = None
+        self._lookup = None
+        
+    def getInfoAtOffset(self, offset):
+        """
+        Returns the heap item stored at the given offset of the stream.
+        
+        The heap streams (C{#Strings}, C{#US}, C{#GUID} and C{#Blob}) keep their items in C{info} as a list of
+        C{{offset: item}} dictionaries. The first call merges them into a single dictionary, so every lookup
+        after that is a plain dictionary access.
+        
+        @type offset: int
+        @param offset: The offset of the item, relative to the start of the stream.
+        
+        @rtype: object
+        @return: The item at the given offset or C{None} if there is no item starting there.
+        """
+        return self.getInfoLookup().get(offset)
+    
+    def getInfoLookup(self):
+        """
+        Returns the items of a heap stream as a single dictionary, see L{getInfoAtOffset}.
+        
+        @rtype: dict
+        @return: A dictionary mapping every item offset to the item.
+        """
+        lookup = self._lookup
+        if lookup is None:
+            lookup = self._lookup = {}
+            for item in self.info:
+                lookup.update(item)
+        return lookup
         
-        self._attrsList = ["offset",  "size",  "name",  "info"]
+    def __str__(self):
+        # the name is stored without its padding and "info" is not part of the structure, so pack
+        # the stream header as it is laid out in the file.
+        return str(self.offset) + str(self.size) + str(datatypes.AlignedString(self.name.value))
+    
+    def __len__(self):
+        return len(str(self))
         
     def getType(self):
         """Returns L{consts.NET_METADATA_STREAM_ENTRY}."""
@@ -1121,24 +1419,70 @@ class NetMetaDataStreamEntry(baseclasses.BaseStructClass):
         @return: A new L{NetMetaDataStreamEntry} object.
         """
         n = NetMetaDataStreamEntry()
-        n.offset.value = readDataInstance.readDword()
-        n.size.value = readDataInstance.readDword()
+        n.offset.value, n.size.value = readDataInstance.readStruct(_netMetaDataStreamStruct)
         n.name.value = readDataInstance.readAlignedString()
         return n
         
-class NetMetaDataStreams(dict):
+class NetMetaDataStreams(list):
     """NetMetaDataStreams object."""
+
+    __slots__ = ("shouldPack", "_streamsByName")
+    __getstate__ = baseclasses._getState
+    __setstate__ = baseclasses._setState
+
     def __init__(self,  shouldPack = True):
+        """
+        Array of L{NetMetaDataStreamEntry} objects, in the same order they appear in the metadata header.
+        
+        The streams can also be looked up by their name, e.g. C{streams["#Strings"]}. As when this object was a
+        dictionary keyed by index and by name, C{in} and L{get} accept both keys.
+        
+        @type shouldPack: bool
+        @param shouldPack: (Optional) If set to c{True}, the object will be packed. If set to C{False}, the object won't be packed.
+        """
+        list.__init__(self)
         self.shouldPack = shouldPack
+        self._streamsByName = {}
+
+    def __getitem__(self, key):
+        if isinstance(key, basestring):
+            return self._streamsByName[key]
+        return list.__getitem__(self, key)
+
+    def __contains__(self, key):
+        if isinstance(key, basestring):
+            return key in self._streamsByName
+        if isinstance(key, (int, long)):
+            return 0 <= key < len(self)
+        return list.__contains__(self, key)
 
     def __str__(self):
-        return "".join([str(x) for x in self if hasattr(x, "shouldPack") and x.shouldPack])
+        return "".join([str(x) for x in self if x.shouldPack])
+
+    def get(self, key, default = None):
+        """
+        Returns the L{NetMetaDataStreamEntry} object at the given index or with the given name.
+
+        @type key: int or str
+        @param key: The index or the name of the stream.
+
+        @type default: object
+        @param default: (Optional) The value returned if there is no such stream.
+
+        @rtype: L{NetMetaDataStreamEntry}
+        @return: The stream, or C{default} if it is not found.
+        """
+        if key in self:
+            return self[key]
+        return default
 
     def getByNumber(self, number):
-        return self.get(name)
+        if 0 <= number < len(self):
+            return list.__getitem__(self, number)
+        return None
 
     def getByName(self, name):
-        return self.get(name)
+        return self._streamsByName.get(name)
         
     def getType(self):
         """Returns L{consts.NET_METADATA_STREAMS}."""
@@ -1160,20 +1504,24 @@ class NetMetaDataStreams(dict):
         """
         streams = NetMetaDataStreams()
         
-        for i in range(nStreams):
+        for _ in repeat(None, nStreams):
             streamEntry = NetMetaDataStreamEntry()
             
-            streamEntry.offset.value = readDataInstance.readDword()
-            streamEntry.size.value = readDataInstance.readDword()
+            streamEntry.offset.value, streamEntry.size.value = readDataInstance.readStruct(_netMetaDataStreamStruct)
             streamEntry.name.value = readDataInstance.readAlignedString()
             
-            #streams.append(streamEntry)
-            streams.update({ i: streamEntry, streamEntry.name.value: streamEntry })
+            streams.append(streamEntry)
+            streams._streamsByName[streamEntry.name.value] = streamEntry
 
         return streams
 
 class NetMetaDataTableHeader(baseclasses.BaseStructClass):
     """NetMetaDataTableHeader object."""
+
+    _attrsList = ("reserved_1",  "majorVersion",  "minorVersion",  "heapOffsetSizes",  "reserved_2",  "maskValid",  "maskSorted")
+    __slots__ = _attrsList
+    _setFields = _fieldsSetter(_attrsList)
+
     def __init__(self,  shouldPack = True):
         baseclasses.BaseStructClass.__init__(self,  shouldPack)
         
@@ -1185,8 +1533,6 @@ class NetMetaDataTableHeader(baseclasses.BaseStructClass):
         self.maskValid = datatypes.QWORD(0) #: L{QWORD} maskValid.
         self.maskSorted = datatypes.QWORD(0) #: L{QWORD} maskSorted.
         
-        self._attrsList = ["reserved_1",  "majorVersion",  "minorVersion",  "heapOffsetSizes",  "reserved_2",  "maskValid",  "maskSorted"]
-        
     def getType(self):
         """Returns L{consts.NET_METADATA_TABLE_HEADER}."""
         return consts.NET_METADATA_TABLE_HEADER
@@ -1204,18 +1550,15 @@ class NetMetaDataTableHeader(baseclasses.BaseStructClass):
         """
         th = NetMetaDataTableHeader()
         
-        th.reserved_1.value = readDataInstance.readDword()
-        th.majorVersion.value = readDataInstance.readByte()
-        th.minorVersion.value = readDataInstance.readByte()
-        th.heapOffsetSizes.value = readDataInstance.readByte()
-        th.reserved_2.value = readDataInstance.readByte()
-        th.maskValid.value = readDataInstance.readQword()
-        th.maskSorted.value = readDataInstance.readQword()
-
+        th._setFields(readDataInstance.readStruct(_netMetaDataTableHeaderStruct))
         return th
         
 class NetMetaDataTables(baseclasses.BaseStructClass):
     """NetMetaDataTables object."""
+
+    _attrsList = ("netMetaDataTableHeader",  "tables")
+    __slots__ = _attrsList
+
     def __init__(self,  shouldPack = True):
         """
         NetMetaDataTables object.
@@ -1227,8 +1570,6 @@ class NetMetaDataTables(baseclasses.BaseStructClass):
         self.netMetaDataTableHeader = NetMetaDataTableHeader() #: L{NetMetaDataTableHeader} netMetaDataTableHeader.
         self.tables = None #: C{str} tables.
         
-        self._attrsList = ["netMetaDataTableHeader",  "tables"]
-        
     def getType(self):
         """Returns L{consts.NET_METADATA_TABLES}."""
         return consts.NET_METADATA_TABLES
@@ -1250,30 +1591,74 @@ class NetMetaDataTables(baseclasses.BaseStructClass):
 
         metadataTableDefinitions = dotnet.MetadataTableDefinitions(dt, netMetaDataStreams)
 
+        # walk the set bits of maskValid only, lowest first, clearing each one as it is visited.
+        maskValid = dt.netMetaDataTableHeader.maskValid.value
+        presentTables = []
+        while maskValid:
+            lowestBit = maskValid & -maskValid
+            presentTables.append(lowestBit.bit_length() - 1)
+            maskValid ^= lowestBit
+        rowCounts = dict(zip(presentTables, readDataInstance.readStruct(Struct("<%dL" % len(presentTables)))))
+        
+        # the coded indexes look up the row counts by table name (see dotnet.MultiTableIndex.dwordIndex()), so
+        # dt.tables keeps them until every row is parsed and the parsed rows go to a new dictionary.
         for i in xrange(64):
-            dt.tables[i] = { "rows": 0 }
-            if dt.netMetaDataTableHeader.maskValid.value >> i & 1:
-                dt.tables[i]["rows"] = readDataInstance.readDword()
+            dt.tables[i] = { "rows": rowCounts.get(i, 0) }
             if i in dotnet.MetadataTableNames:
                 dt.tables[dotnet.MetadataTableNames[i]] = dt.tables[i]
 
+        # the tables missing from maskValid have no rows, only the present ones are read.
+        tables = {}
         for i in xrange(64):
-            dt.tables[i]["data"] = []
-            for j in range(dt.tables[i]["rows"]):
-                row = None
-                if i in metadataTableDefinitions:
-                    row = readDataInstance.readFields(metadataTableDefinitions[i])
-                dt.tables[i]["data"].append(row)
-
-        for i in xrange(64):
+            tables[i] = []
             if i in dotnet.MetadataTableNames:
-                dt.tables[dotnet.MetadataTableNames[i]] = dt.tables[i]["data"]
-            dt.tables[i] = dt.tables[i]["data"]
+                tables[dotnet.MetadataTableNames[i]] = tables[i]
+
+        for i in presentTables:
+            rows = rowCounts[i]
+            fields = metadataTableDefinitions.get(i)
+            if i not in metadataTableDefinitions:
+                data = [None] * rows
+            elif not isinstance(fields, (list, tuple)):
+                # same as ReadData.readFields(), nothing is read for the tables we don't know how to parse.
+                data = [{} for j in xrange(rows)]
+            elif rows:
+                data = _readMetaDataTableRows(readDataInstance, fields, rows)
+            else:
+                data = []
+            
+            tables[i] = data
+            if i in dotnet.MetadataTableNames:
+                tables[dotnet.MetadataTableNames[i]] = data
 
+        dt.tables = tables
         return dt
 
+class _NetResourcesInfo(dict):
+    """
+    Data of the resources of a L{NetResources} object, by resource name.
+    
+    Every resource is stored once. Integer keys are still accepted and are translated to the name of the
+    resource at that position of L{NetResources.resourceNames}.
+    """
+
+    __slots__ = ("_names",)
+    __getstate__ = baseclasses._getState
+    __setstate__ = baseclasses._setState
+
+    def __missing__(self, key):
+        if isinstance(key, (int, long)):
+            try:
+                return self[self._names[key]]
+            except IndexError:
+                pass
+        raise KeyError(key)
+
 class NetResources(baseclasses.BaseStructClass):
     """NetResources object."""
+
+    _attrsList = ("signature", "readerCount", "readerTypeLength", "version", "resourceCount", "resourceTypeCount", "resourceTypes", "resourceHashes", "resourceNameOffsets", "dataSectionOffset", "resourceNames", "resourceOffets", "info")
+
     def __init__(self,  shouldPack = True):
         """
         NetResources object.
@@ -1285,6 +1670,7 @@ class NetResources(baseclasses.BaseStructClass):
         self.signature = datatypes.DWORD(0)
         self.readerCount = datatypes.DWORD(0)
         self.readerTypeLength = datatypes.DWORD(0)
+        self.readerType = None
         self.version = datatypes.DWORD(0)
         self.resourceCount = datatypes.DWORD(0)
         self.resourceTypeCount = datatypes.DWORD(0)
@@ -1296,14 +1682,26 @@ class NetResources(baseclasses.BaseStructClass):
         self.resourceOffsets = None
         self.info = None
 
-        self._attrsList = ["signature", "readerCount", "readerTypeLength", "version", "resourceCount", "resourceTypeCount", "resourceTypes", "resourceHashes", "resourceNameOffsets", "dataSectionOffset", "resourceNames", "resourceOffets", "info"]
-
     def __str__(self):
         return str(self.info)
 
+    def __len__(self):
+        return len(str(self))
+
     def __repr__(self):
         return repr(self.info)
 
+    def __getattr__(self, name):
+        # only reached for the attributes that are not set yet, i.e. while the resources of an object returned
+        # by parse() were not read. They are read only once, even if that fails.
+        readDataInstance = self.__dict__.pop("_readData", None)
+        if readDataInstance is not None:
+            self._readResources(readDataInstance)
+        try:
+            return self.__dict__[name]
+        except KeyError:
+            raise AttributeError("'NetResources' object has no attribute '%s'" % name)
+
     def getType(self):
         """Returns L{consts.NET_RESOURCES}."""
         return consts.NET_RESOURCES
@@ -1312,6 +1710,8 @@ class NetResources(baseclasses.BaseStructClass):
     def parse(readDataInstance):
         """
         Returns a new L{NetResources} object.
+        
+        The resources are not read until one of the attributes of the object is accessed.
 
         @type readDataInstance: L{ReadData}
         @param readDataInstance: A L{ReadData} object with data to be parsed as a L{NetResources} object.
@@ -1319,48 +1719,68 @@ class NetResources(baseclasses.BaseStructClass):
         @rtype: L{NetResources}
         @return: A new L{NetResources} object.
         """
-        r = NetResources()
-
-        r.signature = readDataInstance.readDword()
-        if r.signature != 0xbeefcace:
-            return r
-
-        r.readerCount = readDataInstance.readDword()
-        r.readerTypeLength = readDataInstance.readDword()
-        r.readerType = utils.ReadData(readDataInstance.read(r.readerTypeLength)).readDotNetBlob()
-        r.version = readDataInstance.readDword()
-        r.resourceCount = readDataInstance.readDword()
-        r.resourceTypeCount = readDataInstance.readDword()
-
-        r.resourceTypes = []
-        for i in xrange(r.resourceTypeCount):
-            r.resourceTypes.append(readDataInstance.readDotNetBlob())
-
-        # aligned to 8 bytes
-        readDataInstance.skipBytes(8 - readDataInstance.tell() & 0x7)
-
-        r.resourceHashes = []
-        for i in xrange(r.resourceCount):
-            r.resourceHashes.append(readDataInstance.readDword())
-
-        r.resourceNameOffsets = []
-        for i in xrange(r.resourceCount):
-            r.resourceNameOffsets.append(readDataInstance.readDword())
-
-        r.dataSectionOffset = readDataInstance.readDword()
+        r = NetResources.__new__(NetResources)
+        baseclasses.BaseStructClass.__init__(r)
+        r._readData = readDataInstance
+        return r
 
-        r.resourceNames = []
-        r.resourceOffsets = []
-        base = readDataInstance.tell()
-        for i in xrange(r.resourceCount):
-            readDataInstance.setOffset(base + r.resourceNameOffsets[i])
-            r.resourceNames.append(readDataInstance.readDotNetUnicodeString())
-            r.resourceOffsets.append(readDataInstance.readDword())
+    def _readResources(self, readDataInstance):
+        """
+        Reads the resources into the object.
 
-        r.info = {}
-        for i in xrange(r.resourceCount):
-            readDataInstance.setOffset(r.dataSectionOffset + r.resourceOffsets[i])
-            r.info[i] = readDataInstance.read(len(readDataInstance))
-            r.info[r.resourceNames[i]] = r.info[i]
+        If the resources can't be read, the object is left as a new L{NetResources} object and C{False} is returned.
 
-        return r
+        @type readDataInstance: L{ReadData}
+        @param readDataInstance: The L{ReadData} object received by L{parse}.
+
+        @rtype: bool
+        @return: C{True} if the resources were read, C{False} otherwise.
+        """
+        NetResources.__init__(self, self.shouldPack)
+
+        try:
+            readDataInstance.setOffset(0)
+
+            self.signature = readDataInstance.readDword()
+            if self.signature != 0xbeefcace:
+                return True
+
+            self.readerCount, self.readerTypeLength = readDataInstance.readStruct(_netResourcesReaderStruct)
+            self.readerType = utils.ReadData(readDataInstance.read(self.readerTypeLength)).readDotNetBlob()
+            self.version, self.resourceCount, self.resourceTypeCount = readDataInstance.readStruct(_netResourcesCountsStruct)
+
+            self.resourceTypes = [readDataInstance.readDotNetBlob() for _ in repeat(None, self.resourceTypeCount)]
+
+            # aligned to 8 bytes
+            readDataInstance.skipBytes(-readDataInstance.tell() & 0x7)
+
+            self.resourceHashes = list(datatypes.Array.parseValues(readDataInstance, datatypes.TYPE_DWORD, self.resourceCount))
+            self.resourceNameOffsets = list(datatypes.Array.parseValues(readDataInstance, datatypes.TYPE_DWORD, self.resourceCount))
+
+            self.dataSectionOffset = readDataInstance.readDword()
+
+            self.resourceNames = []
+            self.resourceOffsets = []
+            base = readDataInstance.tell()
+            for i in xrange(self.resourceCount):
+                readDataInstance.setOffset(base + self.resourceNameOffsets[i])
+                self.resourceNames.append(readDataInstance.readDotNetUnicodeString())
+                self.resourceOffsets.append(readDataInstance.readDword())
+
+            # the data of a resource ends where the next one (by offset, the table isn't sorted that way) starts
+            # or at the end of the data section for the last one.
+            starts = sorted(set([self.dataSectionOffset + offset for offset in self.resourceOffsets]))
+            ends = dict(izip(starts, starts[1:] + [readDataInstance.length]))
+
+            self.info = _NetResourcesInfo()
+            self.info._names = self.resourceNames
+            for name, offset in izip(self.resourceNames, self.resourceOffsets):
+                start = self.dataSectionOffset + offset
+                readDataInstance.setOffset(start)
+                self.info[name] = readDataInstance.read(ends[start] - start)
+        except Exception:
+            # the errors of a corrupt resource are not raised from an attribute lookup (hasattr() would hide them).
+            NetResources.__init__(self, self.shouldPack)
+            print excep.PEWarning("Error parsing .NET resources.")
+            return False
+        return True
@@ -28,153 +28,152 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
-import sys
-
 import datatypes
-import caching
+import baseclasses
+
+class HeapIndex(object):
+
+    # name of the stream the index points into and the bit of heapOffsetSizes that tells if the index
+    # takes a dword. They are set by the subclasses.
+    heapName = None
+    sizeFlag = None
 
-class StringHeapIndex(object):
+    __slots__ = ("dt", "streams", "offset", "_dwordIndex")
+    __getstate__ = baseclasses._getState
+    __setstate__ = baseclasses._setState
 
     def __init__(self, dt, streams):
+        if not self.heapName: raise NotImplementedError
         self.dt = dt
         self.streams = streams
-        self.offset = 0
-        self.value = None
-
-    def getString(self, offset):
-        funcname = sys._getframe().f_code.co_name
-        cache = caching.getCache(funcname)
-        result = cache.get(offset)
-        if result is not None: return result
+        self.offset = None
+        # heapOffsetSizes doesn't change once the table header was read, so it is checked only once.
+        self._dwordIndex = None
 
-        for i in self.streams["#Strings"].info:
-            cache.put(*i.iteritems().next())
-
-        return cache.get(offset)
-
-    def parse(self, readDataInstance):
-        if self.dt.netMetaDataTableHeader.heapOffsetSizes.value & 0x1:
-            self.offset = datatypes.DWORD(readDataInstance.readDword()).value
-        else:
-            self.offset = datatypes.WORD(readDataInstance.readWord()).value
-        self.value = self.getString(self.offset)
-        return self
+    @property
+    def value(self):
+        # the item is looked up in the heap when it is asked for, parse() only reads the index.
+        if self.offset is None:
+            return None
+        return self.decode(self.offset)
 
-class GuidHeapIndex(object):
+    def getItem(self, offset):
+        return self.streams[self.heapName].getInfoAtOffset(offset)
 
-    def __init__(self, dt, streams):
-        self.dt = dt
-        self.streams = streams
-        self.offset = 0
-        self.value = None
+    def dwordIndex(self):
+        if self._dwordIndex is None:
+            self._dwordIndex = bool(self.dt.netMetaDataTableHeader.heapOffsetSizes.value & self.sizeFlag)
+        return self._dwordIndex
 
-    def getGuid(self, offset):
-        funcname = sys._getframe().f_code.co_name
-        cache = caching.getCache(funcname)
-        result = cache.get(offset)
-        if result is not None: return result
+    def getFormat(self):
+        # struct format character of the index, it depends on the size of the heap.
+        if self.dwordIndex():
+            return "L"
+        return "H"
 
-        for i in self.streams["#GUID"].info:
-            cache.put(*i.iteritems().next())
+    def decode(self, offset):
+        return self.getItem(offset)
 
-        return cache.get(offset)
+    def decodeColumn(self, offsets):
+        # the heap dictionary is fetched once for the whole column.
+        return map(self.streams[self.heapName].getInfoLookup().get, offsets)
 
     def parse(self, readDataInstance):
-        if self.dt.netMetaDataTableHeader.heapOffsetSizes.value & 0x2:
-            self.offset = datatypes.DWORD(readDataInstance.readDword()).value
+        if self.dwordIndex():
+            self.offset = readDataInstance.readDword()
         else:
-            self.offset = datatypes.WORD(readDataInstance.readWord()).value
-        self.value = self.getGuid(16*(self.offset-1))
+            self.offset = readDataInstance.readWord()
         return self
 
-class BlobHeapIndex(object):
+class StringHeapIndex(HeapIndex):
+    __slots__ = ()
+    heapName = "#Strings"
+    sizeFlag = 0x1
 
-    def __init__(self, dt, streams):
-        self.dt = dt
-        self.streams = streams
-        self.offset = 0
-        self.value = None
+    def getString(self, offset):
+        return self.getItem(offset)
 
-    def getBlob(self, offset):
-        funcname = sys._getframe().f_code.co_name
-        cache = caching.getCache(funcname)
-        result = cache.get(offset)
-        if result is not None: return result
+class GuidHeapIndex(HeapIndex):
+    __slots__ = ()
+    heapName = "#GUID"
+    sizeFlag = 0x2
 
-        for i in self.streams["#Blob"].info:
-            cache.put(*i.iteritems().next())
+    def getGuid(self, offset):
+        return self.getItem(offset)
 
-        return cache.get(offset)
+    # the GUID heap is indexed by number (starting at 1) instead of by offset.
+    def decode(self, offset):
+        return self.getItem(16*(offset-1))
 
-    def parse(self, readDataInstance):
-        if self.dt.netMetaDataTableHeader.heapOffsetSizes.value & 0x4:
-            self.offset = datatypes.DWORD(readDataInstance.readDword()).value
-        else:
-            self.offset = datatypes.WORD(readDataInstance.readWord()).value
-        self.value = self.getBlob(self.offset)
-        return self
+    def decodeColumn(self, offsets):
+        lookup = self.streams[self.heapName].getInfoLookup()
+        return [lookup.get(16*(offset-1)) for offset in offsets]
+
+class BlobHeapIndex(HeapIndex):
+    __slots__ = ()
+    heapName = "#Blob"
+    sizeFlag = 0x4
+
+    def getBlob(self, offset):
+        return self.getItem(offset)
 
 
 class MultiTableIndex(object):
 
     refs = None
 
+    __slots__ = ("dt", "streams", "value", "_bits", "_mask", "_dwordIndex")
+    __getstate__ = baseclasses._getState
+    __setstate__ = baseclasses._setState
+
     def __init__(self, dt=None, streams=None):
         if not self.refs: raise NotImplementedError
         self.dt = dt
         self.streams = streams
         self.value = None
-        self.hash = "{0:x}".format(hash(self.refs))
+        # the low bits of a coded index tell the table, the rest of them are the row.
+        self._bits = self.getBits(len(self.refs))
+        self._mask = (1 << self._bits) - 1
+        # the size of the index only depends on the row counts of the tables, which don't change
+        # once the table header was read, so it is worked out the first time it is needed.
+        self._dwordIndex = None
 
     @staticmethod
     def getBits(value):
-        funcname = sys._getframe().f_code.co_name
-        cache = caching.getCache(funcname)
-        bits = cache.get(value)
-        if bits is not None: return bits
-
-        bits = 0
-        tmp = value - 1
-        while tmp > 0:
-            bits += 1
-            tmp >>= 1
-
-        cache.put(value, bits)
-        return bits
+        # number of bits needed to tell apart value different items, 0 when there are less than two.
+        return max(value - 1, 0).bit_length()
 
     def dwordIndex(self):
-        funcname = sys._getframe().f_code.co_name
-        cache = caching.getCache(funcname)
-        result = cache.get(self.hash)
-        if result is not None: return result
-
-        largestTable = max(self.dt.tables[_]["rows"] for _ in self.refs if _ != "Not used")
-        result = self.getBits(largestTable) > 16 - self.getBits(len(self.refs))
-
-        cache.put(self.hash, result)
-        return result
+        if self._dwordIndex is None:
+            largestTable = max(self.dt.tables[_]["rows"] for _ in self.refs if _ != "Not used")
+            self._dwordIndex = self.getBits(largestTable) > 16 - self._bits
+        return self._dwordIndex
 
     def decodeValue(self, value):
-        funcname = sys._getframe().f_code.co_name
-        cache = caching.getCache(funcname + "#" + self.hash)
-        result = cache.get(value)
-        if result is not None: return result
+        return (self.refs[value & self._mask], value >> self._bits)
+
+    def getFormat(self):
+        if self.dwordIndex():
+            return "L"
+        return "H"
 
-        bits = self.getBits(len(self.refs))
-        result = (self.refs[value & (1 << bits)-1], value >> bits)
+    def decode(self, value):
+        return self.decodeValue(value)
 
-        cache.put(value, result)
-        return result
+    def decodeColumn(self, values):
+        refs, mask, bits = self.refs, self._mask, self._bits
+        return [(refs[value & mask], value >> bits) for value in values]
 
     def parse(self, readDataInstance):
         if self.dwordIndex():
-            self.value = self.decodeValue(datatypes.DWORD(readDataInstance.readDword()).value)
+            self.value = self.decodeValue(readDataInstance.readDword())
         else:
-            self.value = self.decodeValue(datatypes.WORD(readDataInstance.readWord()).value)
+            self.value = self.decodeValue(readDataInstance.readWord())
         return self
 
 
 class TypeDefOrRefIndex(MultiTableIndex):
+    __slots__ = ()
     refs = (
         "TypeDef",
         "TypeRef",
@@ -182,6 +181,7 @@ class TypeDefOrRefIndex(MultiTableIndex):
     )
 
 class HasConstantIndex(MultiTableIndex):
+    __slots__ = ()
     refs = (
         "Field",
         "Param",
@@ -189,6 +189,7 @@ class HasConstantIndex(MultiTableIndex):
     )
 
 class HasCustomAttributeIndex(MultiTableIndex):
+    __slots__ = ()
     refs = (
         "MethodDef",
         "Field",
@@ -209,10 +210,14 @@ class HasCustomAttributeIndex(MultiTableIndex):
         "File",
         "ExportedType",
         "ManifestResource",
+        "GenericParam",
+        "GenericParamConstraint",
+        "MethodSpec",
     )
 
 
 class HasFieldMarshallIndex(MultiTableIndex):
+    __slots__ = ()
     refs = (
         "Field",
         "Param",
@@ -220,6 +225,7 @@ class HasFieldMarshallIndex(MultiTableIndex):
 
 
 class HasDeclSecurityIndex(MultiTableIndex):
+    __slots__ = ()
     refs = (
         "TypeDef",
         "MethodDef",
@@ -228,6 +234,7 @@ class HasDeclSecurityIndex(MultiTableIndex):
 
 
 class MemberRefParentIndex(MultiTableIndex):
+    __slots__ = ()
     refs = (
         "TypeDef",
         "TypeRef",
@@ -238,6 +245,7 @@ class MemberRefParentIndex(MultiTableIndex):
 
 
 class HasSemanticsIndex(MultiTableIndex):
+    __slots__ = ()
     refs = (
         "Event",
         "Property",
@@ -245,6 +253,7 @@ class HasSemanticsIndex(MultiTableIndex):
 
 
 class MethodDefOrRefIndex(MultiTableIndex):
+    __slots__ = ()
     refs = (
         "MethodDef",
         "MemberRef",
@@ -252,6 +261,7 @@ class MethodDefOrRefIndex(MultiTableIndex):
 
 
 class MemberForwardedIndex(MultiTableIndex):
+    __slots__ = ()
     refs = (
         "Field",
         "MethodDef",
@@ -259,6 +269,7 @@ class MemberForwardedIndex(MultiTableIndex):
 
 
 class ImplementationIndex(MultiTableIndex):
+    __slots__ = ()
     refs = (
         "File",
         "AssemblyRef",
@@ -267,6 +278,7 @@ class ImplementationIndex(MultiTableIndex):
 
 
 class CustomAttributeTypeIndex(MultiTableIndex):
+    __slots__ = ()
     refs = (
         "Not used",
         "Not used",
@@ -277,6 +289,7 @@ class CustomAttributeTypeIndex(MultiTableIndex):
 
 
 class ResolutionScopeIndex(MultiTableIndex):
+    __slots__ = ()
     refs = (
         "Module",
         "ModuleRef",
@@ -286,6 +299,7 @@ class ResolutionScopeIndex(MultiTableIndex):
 
 
 class TypeOrMethodDefIndex(MultiTableIndex):
+    __slots__ = ()
     refs = (
         "TypeDef",
         "MethodDef",
@@ -293,54 +307,63 @@ class TypeOrMethodDefIndex(MultiTableIndex):
 
 
 class FieldIndex(MultiTableIndex):
+    __slots__ = ()
     refs = (
         "Field",
     )
 
 
 class MethodDefIndex(MultiTableIndex):
+    __slots__ = ()
     refs = (
         "MethodDef",
     )
 
 
 class ParamIndex(MultiTableIndex):
+    __slots__ = ()
     refs = (
         "Param",
     )
 
 
 class TypeDefIndex(MultiTableIndex):
+    __slots__ = ()
     refs = (
         "TypeDef",
     )
 
 
 class EventIndex(MultiTableIndex):
+    __slots__ = ()
     refs = (
         "Event",
     )
 
 
 class PropertyIndex(MultiTableIndex):
+    __slots__ = ()
     refs = (
         "Property",
     )
 
 
 class ModuleRefIndex(MultiTableIndex):
+    __slots__ = ()
     refs = (
         "ModuleRef",
     )
 
 
 class AssemblyRefIndex(MultiTableIndex):
+    __slots__ = ()
     refs = (
         "AssemblyRef",
     )
 
 
 class GenericParamIndex(MultiTableIndex):
+    __slots__ = ()
     refs = (
         "GenericParam",
     )
@@ -414,222 +437,235 @@ MetadataTableNames = {
 }
 
 
+# the fixed-size columns only tell the width of the field, so every table of every assembly shares these objects.
+_wordColumn = datatypes.WORD()
+_dwordColumn = datatypes.DWORD()
+
+
 def MetadataTableDefinitions(dt, netMetaDataStreams):
+    # the index objects don't keep anything from one row to the next, so a single instance of every
+    # index type is shared by all the columns that use it.
+    indexes = {}
+    def index(indexClass):
+        if indexClass not in indexes:
+            indexes[indexClass] = indexClass(dt, netMetaDataStreams)
+        return indexes[indexClass]
+
     return {
         0x00: [
-            { "generation": datatypes.WORD() },
-            { "name": StringHeapIndex(dt, netMetaDataStreams) },
-            { "mvId": GuidHeapIndex(dt, netMetaDataStreams) },
-            { "encId": GuidHeapIndex(dt, netMetaDataStreams) },
-            { "encBaseId": GuidHeapIndex(dt, netMetaDataStreams) },
+            { "generation": _wordColumn },
+            { "name": index(StringHeapIndex) },
+            { "mvId": index(GuidHeapIndex) },
+            { "encId": index(GuidHeapIndex) },
+            { "encBaseId": index(GuidHeapIndex) },
         ],
         0x01: [
-            { "resolutionScope": ResolutionScopeIndex(dt, netMetaDataStreams) },
-            { "typeName": StringHeapIndex(dt, netMetaDataStreams) },
-            { "typeNamespace": StringHeapIndex(dt, netMetaDataStreams) },
+            { "resolutionScope": index(ResolutionScopeIndex) },
+            { "typeName": index(StringHeapIndex) },
+            { "typeNamespace": index(StringHeapIndex) },
         ],
         0x02: [
-            { "flags": datatypes.DWORD() },
-            { "typeName": StringHeapIndex(dt, netMetaDataStreams) },
-            { "typeNamespace": StringHeapIndex(dt, netMetaDataStreams) },
-            { "extends": TypeDefOrRefIndex(dt, netMetaDataStreams) },
-            { "fieldList": FieldIndex(dt, netMetaDataStreams) },
-            { "methodList": MethodDefIndex(dt, netMetaDataStreams) },
+            { "flags": _dwordColumn },
+            { "typeName": index(StringHeapIndex) },
+            { "typeNamespace": index(StringHeapIndex) },
+            { "extends": index(TypeDefOrRefIndex) },
+            { "fieldList": index(FieldIndex) },
+            { "methodList": index(MethodDefIndex) },
         ],
         0x03: [
-            { "ref": datatypes.WORD() },
+            { "ref": _wordColumn },
         ],
         0x04: [
-            { "flags": datatypes.WORD() },
-            { "name": StringHeapIndex(dt, netMetaDataStreams) },
-            { "signature": BlobHeapIndex(dt, netMetaDataStreams) },
+            { "flags": _wordColumn },
+            { "name": index(StringHeapIndex) },
+            { "signature": index(BlobHeapIndex) },
         ],
         0x05: [
-            { "ref": datatypes.WORD() },
+            { "ref": _wordColumn },
         ],
         0x06: [
-            { "rva": datatypes.DWORD() },
-            { "implFlags": datatypes.WORD() },
-            { "flags": datatypes.WORD() },
-            { "name": StringHeapIndex(dt, netMetaDataStreams) },
-            { "signature": BlobHeapIndex(dt, netMetaDataStreams) },
-            { "paramList": ParamIndex(dt, netMetaDataStreams) },
+            { "rva": _dwordColumn },
+            { "implFlags": _wordColumn },
+            { "flags": _wordColumn },
+            { "name": index(StringHeapIndex) },
+            { "signature": index(BlobHeapIndex) },
+            { "paramList": index(ParamIndex) },
         ],
         0x07: [
-            { "ref": datatypes.WORD() },
+            { "ref": _wordColumn },
         ],
         0x08: [
-            { "flags": datatypes.WORD() },
-            { "sequence": datatypes.WORD() },
-            { "name": StringHeapIndex(dt, netMetaDataStreams) },
+            { "flags": _wordColumn },
+            { "sequence": _wordColumn },
+            { "name": index(StringHeapIndex) },
         ],
         0x09: [
-            { "class": TypeDefIndex(dt, netMetaDataStreams) },
-            { "interface": TypeDefOrRefIndex(dt, netMetaDataStreams) },
+            { "class": index(TypeDefIndex) },
+            { "interface": index(TypeDefOrRefIndex) },
         ],
         0x0a: [
-            { "class": MemberRefParentIndex(dt, netMetaDataStreams) },
-            { "name": StringHeapIndex(dt, netMetaDataStreams) },
-            { "signature": BlobHeapIndex(dt, netMetaDataStreams) },
+            { "class": index(MemberRefParentIndex) },
+            { "name": index(StringHeapIndex) },
+            { "signature": index(BlobHeapIndex) },
         ],
         0x0b: [
-            { "type": datatypes.WORD() },
-            { "parent": HasConstantIndex(dt, netMetaDataStreams) },
-            { "value": BlobHeapIndex(dt, netMetaDataStreams) },
+            { "type": _wordColumn },
+            { "parent": index(HasConstantIndex) },
+            { "value": index(BlobHeapIndex) },
         ],
         0x0c: [
-            { "parent": HasCustomAttributeIndex(dt, netMetaDataStreams) },
-            { "type": CustomAttributeTypeIndex(dt, netMetaDataStreams) },
-            { "value": BlobHeapIndex(dt, netMetaDataStreams) },
+            { "parent": index(HasCustomAttributeIndex) },
+            { "type": index(CustomAttributeTypeIndex) },
+            { "value": index(BlobHeapIndex) },
         ],
         0x0d: [
-            { "parent": HasFieldMarshallIndex(dt, netMetaDataStreams) },
-            { "nativeType": BlobHeapIndex(dt, netMetaDataStreams) },
+            { "parent": index(HasFieldMarshallIndex) },
+            { "nativeType": index(BlobHeapIndex) },
         ],
         0x0e: [
-            { "action": datatypes.WORD() },
-            { "parent": HasDeclSecurityIndex(dt, netMetaDataStreams) },
-            { "permissionSet": BlobHeapIndex(dt, netMetaDataStreams) },
+            { "action": _wordColumn },
+            { "parent": index(HasDeclSecurityIndex) },
+            { "permissionSet": index(BlobHeapIndex) },
         ],
         0x0f: [
-            { "packingSize": datatypes.WORD() },
-            { "classSize": datatypes.DWORD() },
-            { "parent": TypeDefIndex(dt, netMetaDataStreams) },
+            { "packingSize": _wordColumn },
+            { "classSize": _dwordColumn },
+            { "parent": index(TypeDefIndex) },
         ],
         0x10: [
-            { "offset": datatypes.DWORD() },
-            { "field": FieldIndex(dt, netMetaDataStreams) },
+            { "offset": _dwordColumn },
+            { "field": index(FieldIndex) },
         ],
         0x11: [
-            { "signature": BlobHeapIndex(dt, netMetaDataStreams) },
+            { "signature": index(BlobHeapIndex) },
         ],
         0x12: [
-            { "parent": TypeDefIndex(dt, netMetaDataStreams) },
-            { "eventList": EventIndex(dt, netMetaDataStreams) },
+            { "parent": index(TypeDefIndex) },
+            { "eventList": index(EventIndex) },
         ],
         0x13: [
-            { "ref": datatypes.WORD() },
+            { "ref": _wordColumn },
         ],
         0x14: [
-            { "eventFlags": datatypes.WORD() },
-            { "name": StringHeapIndex(dt, netMetaDataStreams) },
-            { "eventType": TypeDefOrRefIndex(dt, netMetaDataStreams) },
+            { "eventFlags": _wordColumn },
+            { "name": index(StringHeapIndex) },
+            { "eventType": index(TypeDefOrRefIndex) },
         ],
         0x15: [
-            { "parent": TypeDefIndex(dt, netMetaDataStreams) },
-            { "propertyList": PropertyIndex(dt, netMetaDataStreams) },
+            { "parent": index(TypeDefIndex) },
+            { "propertyList": index(PropertyIndex) },
         ],
         0x16: [
-            { "ref": datatypes.WORD() },
+            { "ref": _wordColumn },
         ],
         0x17: [
-            { "flags": datatypes.WORD() },
-            { "name": StringHeapIndex(dt, netMetaDataStreams) },
-            { "type": BlobHeapIndex(dt, netMetaDataStreams) },
+            { "flags": _wordColumn },
+            { "name": index(StringHeapIndex) },
+            { "type": index(BlobHeapIndex) },
         ],
         0x18: [
-            { "semantics": datatypes.WORD() },
-            { "method": MethodDefIndex(dt, netMetaDataStreams) },
-            { "association": HasSemanticsIndex(dt, netMetaDataStreams) },
+            { "semantics": _wordColumn },
+            { "method": index(MethodDefIndex) },
+            { "association": index(HasSemanticsIndex) },
         ],
         0x19: [
-            { "class": TypeDefIndex(dt, netMetaDataStreams) },
-            { "methodBody": MethodDefOrRefIndex(dt, netMetaDataStreams) },
-            { "methodDeclaration": MethodDefOrRefIndex(dt, netMetaDataStreams) },
+            { "class": index(TypeDefIndex) },
+            { "methodBody": index(MethodDefOrRefIndex) },
+            { "methodDeclaration": index(MethodDefOrRefIndex) },
         ],
         0x1a: [
-            { "name": StringHeapIndex(dt, netMetaDataStreams) },
+            { "name": index(StringHeapIndex) },
         ],
         0x1b: [
-            { "signature": BlobHeapIndex(dt, netMetaDataStreams) },
+            { "signature": index(BlobHeapIndex) },
         ],
         0x1c: [
-            { "mappingFlags": datatypes.WORD() },
-            { "memberForwarded": MemberForwardedIndex(dt, netMetaDataStreams) },
-            { "importName": StringHeapIndex(dt, netMetaDataStreams) },
-            { "importScope": ModuleRefIndex(dt, netMetaDataStreams) },
+            { "mappingFlags": _wordColumn },
+            { "memberForwarded": index(MemberForwardedIndex) },
+            { "importName": index(StringHeapIndex) },
+            { "importScope": index(ModuleRefIndex) },
         ],
         0x1d: [
-            { "rva": datatypes.DWORD() },
-            { "field": FieldIndex(dt, netMetaDataStreams) },
+            { "rva": _dwordColumn },
+            { "field": index(FieldIndex) },
         ],
         0x1e: None,
         0x1f: None,
         0x20: [
-            { "hashAlgId": datatypes.DWORD() },
-            { "majorVersion": datatypes.WORD() },
-            { "minorVersion": datatypes.WORD() },
-            { "buildNumber": datatypes.WORD() },
-            { "revisionNumber": datatypes.WORD() },
-            { "flags": datatypes.DWORD() },
-            { "publicKey": BlobHeapIndex(dt, netMetaDataStreams) },
-            { "name": StringHeapIndex(dt, netMetaDataStreams) },
-            { "culture": StringHeapIndex(dt, netMetaDataStreams) },
+            { "hashAlgId": _dwordColumn },
+            { "majorVersion": _wordColumn },
+            { "minorVersion": _wordColumn },
+            { "buildNumber": _wordColumn },
+            { "revisionNumber": _wordColumn },
+            { "flags": _dwordColumn },
+            { "publicKey": index(BlobHeapIndex) },
+            { "name": index(StringHeapIndex) },
+            { "culture": index(StringHeapIndex) },
         ],
         0x21: [
-            { "processor": datatypes.DWORD() },
+            { "processor": _dwordColumn },
         ],
         0x22: [
-            { "osPlatformId": datatypes.DWORD() },
-            { "osMajorVersion": datatypes.DWORD() },
-            { "osMinorVersion": datatypes.DWORD() },
+            { "osPlatformId": _dwordColumn },
+            { "osMajorVersion": _dwordColumn },
+            { "osMinorVersion": _dwordColumn },
         ],
         0x23: [
-            { "majorVersion": datatypes.WORD() },
-            { "minorVersion": datatypes.WORD() },
-            { "buildNumber": datatypes.WORD() },
-            { "revisionNumber": datatypes.WORD() },
-            { "flags": datatypes.DWORD() },
-            { "publicKeyOrToken": BlobHeapIndex(dt, netMetaDataStreams) },
-            { "name": StringHeapIndex(dt, netMetaDataStreams) },
-            { "culture": StringHeapIndex(dt, netMetaDataStreams) },
-            { "hashValue": BlobHeapIndex(dt, netMetaDataStreams) },
+            { "majorVersion": _wordColumn },
+            { "minorVersion": _wordColumn },
+            { "buildNumber": _wordColumn },
+            { "revisionNumber": _wordColumn },
+            { "flags": _dwordColumn },
+            { "publicKeyOrToken": index(BlobHeapIndex) },
+            { "name": index(StringHeapIndex) },
+            { "culture": index(StringHeapIndex) },
+            { "hashValue": index(BlobHeapIndex) },
         ],
         0x24: [
-            { "processor": datatypes.DWORD() },
-            { "assemblyRef": AssemblyRefIndex(dt, netMetaDataStreams) },
+            { "processor": _dwordColumn },
+            { "assemblyRef": index(AssemblyRefIndex) },
         ],
         0x25: [
-            { "osPlatformId": datatypes.DWORD() },
-            { "osMajorVersion": datatypes.DWORD() },
-            { "osMinorVersion": datatypes.DWORD() },
-            { "assemblyRef": AssemblyRefIndex(dt, netMetaDataStreams) },
+            { "osPlatformId": _dwordColumn },
+            { "osMajorVersion": _dwordColumn },
+            { "osMinorVersion": _dwordColumn },
+            { "assemblyRef": index(AssemblyRefIndex) },
         ],
         0x26: [
-            { "flags": datatypes.DWORD() },
-            { "name": StringHeapIndex(dt, netMetaDataStreams) },
-            { "hashValue": BlobHeapIndex(dt, netMetaDataStreams) },
+            { "flags": _dwordColumn },
+            { "name": index(StringHeapIndex) },
+            { "hashValue": index(BlobHeapIndex) },
         ],
         0x27: [
-            { "flags": datatypes.DWORD() },
-            { "typeDefId": datatypes.DWORD() },
-            { "typeName": StringHeapIndex(dt, netMetaDataStreams) },
-            { "typeNamespace": StringHeapIndex(dt, netMetaDataStreams) },
-            { "implementation": ImplementationIndex(dt, netMetaDataStreams) },
+            { "flags": _dwordColumn },
+            { "typeDefId": _dwordColumn },
+            { "typeName": index(StringHeapIndex) },
+            { "typeNamespace": index(StringHeapIndex) },
+            { "implementation": index(ImplementationIndex) },
         ],
         0x28: [
-            { "offset": datatypes.DWORD() },
-            { "flags": datatypes.DWORD() },
-            { "name": StringHeapIndex(dt, netMetaDataStreams) },
-            { "implementation": ImplementationIndex(dt, netMetaDataStreams) },
+            { "offset": _dwordColumn },
+            { "flags": _dwordColumn },
+            { "name": index(StringHeapIndex) },
+            { "implementation": index(ImplementationIndex) },
         ],
         0x29: [
-            { "nestedClass": TypeDefIndex(dt, netMetaDataStreams) },
-            { "enclosingClass": TypeDefIndex(dt, netMetaDataStreams) },
+            { "nestedClass": index(TypeDefIndex) },
+            { "enclosingClass": index(TypeDefIndex) },
         ],
         0x2a: [
-            { "number": datatypes.WORD() },
-            { "flags": datatypes.WORD() },
-            { "owner": TypeOrMethodDefIndex(dt, netMetaDataStreams) },
-            { "name": StringHeapIndex(dt, netMetaDataStreams) },
+            { "number": _wordColumn },
+            { "flags": _wordColumn },
+            { "owner": index(TypeOrMethodDefIndex) },
+            { "name": index(StringHeapIndex) },
         ],
         0x2b: [
-            { "method": MethodDefOrRefIndex(dt, netMetaDataStreams) },
-            { "instantiation": BlobHeapIndex(dt, netMetaDataStreams) },
+            { "method": index(MethodDefOrRefIndex) },
+            { "instantiation": index(BlobHeapIndex) },
         ],
         0x2c: [
-            { "owner": GenericParamIndex(dt, netMetaDataStreams) },
-            { "constraint": TypeDefOrRefIndex(dt, netMetaDataStreams) },
+            { "owner": index(GenericParamIndex) },
+            { "constraint": index(TypeDefOrRefIndex) },
         ],
         0x2d: None,
         0x2e: None,
@@ -54,6 +54,7 @@ __all__ = [
            ]
            
 import os
+import mmap
 import hashlib
 import binascii
 
@@ -65,7 +66,13 @@ import utils
 import directories
 import baseclasses
 
-from struct import pack, unpack
+from struct import Struct, pack, unpack
+from itertools import repeat
+
+# compiled formats of the thunks and hints read while walking the import directory.
+_thunk32Struct = Struct("<L")
+_thunk64Struct = Struct("<Q")
+_hintStruct = Struct("<H")
 
 class PE(object):
     """PE object."""
@@ -103,6 +110,8 @@ class PE(object):
 
         self._data = data
         self._pathToFile = pathToFile
+        # packed representation of the PE while its directories are being parsed, see _parseDirectories().
+        self._packedData = None
 
         self._verbose = verbose
         self._fastLoad = fastLoad
@@ -116,7 +125,7 @@ class PE(object):
                 
                 stat = os.stat(self._pathToFile)
                 if stat.st_size == 0:
-                    raise PEException("File is empty.")
+                    raise excep.PEException("File is empty.")
                     
                 self._data = self.readFile(self._pathToFile)
                 rd = utils.ReadData(self._data)
@@ -174,7 +183,14 @@ class PE(object):
         if self.dosHeader.e_magic.value != consts.MZ_SIGNATURE:
             raise excep.PEException("Invalid MZ signature. Found %d instead of %d." % (self.dosHeader.magic.value, consts.MZ_SIGNATURE))
         
-        if self.dosHeader.e_lfanew.value > len(self):
+        # the PE was just loaded from self._data, so its size is taken from there instead of packing
+        # the whole PE (a full copy of the file) only to compare one field against it.
+        if isinstance(self._data, (str, mmap.mmap)):
+            size = len(self._data)
+        else:
+            size = len(self)
+            
+        if self.dosHeader.e_lfanew.value > size:
             raise excep.PEException("Invalid e_lfanew value. Probably not a PE file.")
             
         if self.ntHeaders.signature.value != consts.PE_SIGNATURE: 
@@ -187,17 +203,28 @@ class PE(object):
         """
         Returns data from a file.
         
+        The file is memory-mapped in read-only mode, so only the pages that are actually parsed are read from disk.
+        
         @type pathToFile: str
         @param pathToFile: Path to the file.
         
-        @rtype: str
-        @return: The data from file.
+        @rtype: mmap.mmap
+        @return: A read-only mapping of the file. It supports the same indexing and slicing operations as C{str}.
         """
         fd = open(pathToFile,  "rb")
-        data = fd.read()
-        fd.close()
+        try:
+            data = mmap.mmap(fd.fileno(), 0, access = mmap.ACCESS_READ)
+        finally:
+            fd.close()
         return data
-    
+
+    def __getstate__(self):
+        # a mapping made by readFile() can't be pickled (nor deep-copied), the copy gets its contents instead.
+        state = self.__dict__.copy()
+        if isinstance(self._data, mmap.mmap):
+            state["_data"] = self._data[:]
+        return state
+
     def write(self, filename = ""):
         """
         Writes data from L{PE} object to a file.
@@ -209,6 +236,12 @@ class PE(object):
         """
         file_data = str(self)
         if filename:
+            # the original file could still be mapped by readFile() and some platforms
+            # refuse to truncate a mapped file, so stop using the mapping before writing.
+            if isinstance(self._data, mmap.mmap):
+                mappedData = self._data
+                self._data = mappedData[:]
+                mappedData.close()
             try:
                 self.__write(filename, file_data)
             except IOError:
@@ -234,6 +267,9 @@ class PE(object):
         return len(str(self))
         
     def __str__(self):
+        if self._packedData is not None:
+            return self._packedData
+        
         if self._data is None and self._pathToFile is None:
             padding = "\x00" * (self.sectionHeaders[0].pointerToRawData.value - self._getPaddingToSectionOffset())
         else:
@@ -382,7 +418,7 @@ class PE(object):
         @return: An index, starting at 0, that represents the section the given offset belongs to.
         """
         index = -1
-        for i in range(len(self.sectionHeaders)):
+        for i in xrange(len(self.sectionHeaders)):
             if (offset < self.sectionHeaders[i].pointerToRawData.value + self.sectionHeaders[i].sizeOfRawData.value):
                 index = i
                 break
@@ -401,7 +437,7 @@ class PE(object):
         index = -1
         
         if name:
-            for i in range(len(self.sectionHeaders)):
+            for i in xrange(len(self.sectionHeaders)):
                 if self.sectionHeaders[i].name.value.find(name) >= 0:
                     index = i
                     break
@@ -422,11 +458,13 @@ class PE(object):
         if rva < self.sectionHeaders[0].virtualAddress.value:
             return index
         
-        for i in range(len(self.sectionHeaders)):
-            fa = self.ntHeaders.optionalHeader.fileAlignment.value
+        # the file size doesn't change while looking for the section, so the PE is packed only once.
+        fileSize = len(str(self))
+        fa = self.ntHeaders.optionalHeader.fileAlignment.value
+        for i in xrange(len(self.sectionHeaders)):
             prd = self.sectionHeaders[i].pointerToRawData.value
             srd = self.sectionHeaders[i].sizeOfRawData.value
-            if len(str(self)) - self._adjustFileAlignment(prd,  fa) < srd:
+            if fileSize - self._adjustFileAlignment(prd,  fa) < srd:
                 size = self.sectionHeaders[i].misc.value
             else:
                 size = max(srd,  self.sectionHeaders[i].misc.value)
@@ -789,13 +827,12 @@ class PE(object):
         @rtype: L{String}
         @return: A new L{String} object from the given RVA.
         """
-        d = self.getDataAtRva(rva,  1)
-        resultStr = datatypes.String("")
-        while d != "\x00":
-            resultStr.value += d
-            rva += 1
-            d = self.getDataAtRva(rva, 1)
-        return resultStr
+        data = str(self)
+        offset = self.getOffsetFromRva(rva)
+        end = data.find("\x00", offset)
+        if end == -1:
+            end = len(data)
+        return datatypes.String(data[offset:end])
         
     def isExe(self):
         """
@@ -947,13 +984,19 @@ class PE(object):
                          (consts.CONFIGURATION_DIRECTORY, self._parseLoadConfigDirectory),\
                          (consts.NET_METADATA_DIRECTORY, self._parseNetDirectory)]
         
-        for directory in directories:
-            dir = dataDirectoryInstance[directory[0]]
-            if dir.rva.value and dir.size.value:
-                try:
-                    dataDirectoryInstance[directory[0]].info = directory[1](dir.rva.value, dir.size.value, magic)
-                except Exception as e:
-                    print excep.PEWarning("Error parsing PE directory: %s." % directory[1].__name__.replace("_parse", ""))
+        # the directories are read from the packed PE (getDataAtRva(), readStringAtRva(), etc.), which doesn't change
+        # while they are parsed. Pack it once here instead of once per read, there is one read per imported or exported name.
+        self._packedData = str(self)
+        try:
+            for directory in directories:
+                dir = dataDirectoryInstance[directory[0]]
+                if dir.rva.value and dir.size.value:
+                    try:
+                        dataDirectoryInstance[directory[0]].info = directory[1](dir.rva.value, dir.size.value, magic)
+                    except Exception as e:
+                        print excep.PEWarning("Error parsing PE directory: %s." % directory[1].__name__.replace("_parse", ""))
+        finally:
+            self._packedData = None
 
     def _parseResourceDirectory(self, rva, size, magic = consts.PE32):
         """
@@ -1030,12 +1073,11 @@ class PE(object):
         boundImportDirectory = directories.ImageBoundImportDescriptor.parse(rd)
         
         # parse the name of every bounded import.
-        for i in range(len(boundImportDirectory) - 1):
-            if hasattr(boundImportDirectory[i],  "forwarderRefsList"):
-                if boundImportDirectory[i].forwarderRefsList:
-                    for forwarderRefEntry in boundImportDirectory[i].forwarderRefsList:
-                        offset = forwarderRefEntry.offsetModuleName.value
-                        forwarderRefEntry.moduleName = self.readStringAtRva(offset + rva)
+        # every entry gets a forwarderRefsList in its constructor, so there is no need to check for it.
+        for i in xrange(len(boundImportDirectory) - 1):
+            for forwarderRefEntry in boundImportDirectory[i].forwarderRefsList:
+                offset = forwarderRefEntry.offsetModuleName.value
+                forwarderRefEntry.moduleName = self.readStringAtRva(offset + rva)
                         
             offset = boundImportDirectory[i].offsetModuleName.value
             boundImportDirectory[i].moduleName = self.readStringAtRva(offset + rva)
@@ -1066,15 +1108,18 @@ class PE(object):
         # in the directory table, even if the DLL was compiled with SAFESEH:ON. But If that is the case, the sizeof the
         # struct should be 0x48.
         # more information here: http://www.accuvant.com/blog/old-meets-new-microsoft-windows-safeseh-incompatibility
-        data = self.getDataAtRva(rva, directories.ImageLoadConfigDirectory().sizeof())
-        rd = utils.ReadData(data)
-
+        # That's why we don't trust the directory size: the whole structure is read and the parser uses
+        # the size field stored in it to know which fields are really there.
         if magic == consts.PE32:
-            return directories.ImageLoadConfigDirectory.parse(rd)
+            loadConfigClass = directories.ImageLoadConfigDirectory
         elif magic == consts.PE64:
-            return directories.ImageLoadConfigDirectory64.parse(rd)
+            loadConfigClass = directories.ImageLoadConfigDirectory64
         else:
             raise excep.InvalidParameterException("Wrong magic")
+        
+        data = self.getDataAtRva(rva, loadConfigClass().sizeof())
+        rd = utils.ReadData(data)
+        return loadConfigClass.parse(rd)
 
     def _parseTlsDirectory(self, rva, size, magic = consts.PE32):
         """
@@ -1122,12 +1167,7 @@ class PE(object):
         data = self.getDataAtRva(rva,  size)
         #print "Length Relocation data: %x" % len(data)
         rd = utils.ReadData(data)
-        
-        relocsArray = directories.ImageBaseRelocation()
-        while rd.offset < size:
-            relocEntry = directories.ImageBaseRelocationEntry.parse(rd)
-            relocsArray.append(relocEntry)
-        return relocsArray
+        return directories.ImageBaseRelocation.parse(rd, size)
         
     def _parseExportDirectory(self, rva, size, magic = consts.PE32):
         """
@@ -1150,44 +1190,31 @@ class PE(object):
         
         iet = directories.ImageExportTable.parse(rd)
         
-        auxFunctionRvaArray = list()
-        
+        numberOfFunctions = iet.numberOfFunctions.value
         numberOfNames = iet.numberOfNames.value
-        addressOfNames = iet.addressOfNames.value
-        addressOfNameOrdinals = iet.addressOfNameOrdinals.value
-        addressOfFunctions = iet.addressOfFunctions.value
-        
-        # populate the auxFunctionRvaArray
-        for i in xrange(iet.numberOfFunctions.value):
-            auxFunctionRvaArray.append(self.getDwordAtRva(addressOfFunctions).value)
-            addressOfFunctions += datatypes.DWORD().sizeof()
-            
-        for i in xrange(numberOfNames):
-            
-            nameRva = self.getDwordAtRva(addressOfNames).value
-            nameOrdinal = self.getWordAtRva(addressOfNameOrdinals).value
-            exportName = self.readStringAtRva(nameRva).value
+        
+        auxFunctionRvaArray = datatypes.Array.parseValues(utils.ReadData(self.getDataAtRva(iet.addressOfFunctions.value, numberOfFunctions * 4)), datatypes.TYPE_DWORD, numberOfFunctions)
+        nameRvaArray = datatypes.Array.parseValues(utils.ReadData(self.getDataAtRva(iet.addressOfNames.value, numberOfNames * 4)), datatypes.TYPE_DWORD, numberOfNames)
+        nameOrdinalArray = datatypes.Array.parseValues(utils.ReadData(self.getDataAtRva(iet.addressOfNameOrdinals.value, numberOfNames * 2)), datatypes.TYPE_WORD, numberOfNames)
+        
+        base = iet.base.value
+        readStringAtRva = self.readStringAtRva
+        appendEntry = iet.exportTable.append
+        for nameRva, nameOrdinal in zip(nameRvaArray, nameOrdinalArray):
+            exportName = readStringAtRva(nameRva).value
             
             entry = directories.ExportTableEntry()
             
-            ordinal = nameOrdinal + iet.base.value
+            ordinal = nameOrdinal + base
             #print "Ordinal value: %d" % ordinal
-            entry.ordinal.value = ordinal
-            
-            entry.nameOrdinal.vaue = nameOrdinal
-            entry.nameRva.value = nameRva
-            entry.name.value = exportName
-            entry.functionRva.value = auxFunctionRvaArray[nameOrdinal]
+            entry._setFields((ordinal, auxFunctionRvaArray[nameOrdinal], nameOrdinal, nameRva, exportName))
             
-            iet.exportTable.append(entry)
-            
-            addressOfNames += datatypes.DWORD().sizeof()
-            addressOfNameOrdinals += datatypes.WORD().sizeof()
+            appendEntry(entry)
         
         #print "export table length: %d" % len(iet.exportTable)
         
         #print "auxFunctionRvaArray: %r" % auxFunctionRvaArray
-        for i in xrange(iet.numberOfFunctions.value):
+        for i in xrange(numberOfFunctions):
             #print "auxFunctionRvaArray[%d]: %x" % (i,  auxFunctionRvaArray[i])
             if auxFunctionRvaArray[i] != iet.exportTable[i].functionRva.value:
                 entry = directories.ExportTableEntry()
@@ -1272,92 +1299,77 @@ class PE(object):
         if magic == consts.PE64:
             ORDINAL_FLAG = consts.IMAGE_ORDINAL_FLAG64
             ADDRESS_MASK = consts.ADDRESS_MASK64
+            thunkSize = 8
+            unpackThunk = _thunk64Struct.unpack
+            iatEntryClass = directories.ImportAddressTableEntry64
         elif magic == consts.PE32:
             ORDINAL_FLAG = consts.IMAGE_ORDINAL_FLAG
             ADDRESS_MASK = consts.ADDRESS_MASK32
+            thunkSize = 4
+            unpackThunk = _thunk32Struct.unpack
+            iatEntryClass = directories.ImportAddressTableEntry
         else:
             raise InvalidParameterException("magic value %d is not PE64 nor PE32." % magic)
         
-        for i in range(iidLength -1):
+        # bind the methods used on every thunk once, outside the loops. The thunks and hints are
+        # unpacked as plain integers, there is no need to build a DWORD/QWORD/WORD object just to read its value.
+        getDataAtRva = self.getDataAtRva
+        readStringAtRva = self.readStringAtRva
+        
+        for i in xrange(iidLength -1):
+            appendIatEntry = iid[i].iat.append
+            
             if iid[i].originalFirstThunk.value != 0:
                 iltRva = iid[i].originalFirstThunk.value
                 iatRva = iid[i].firstThunk.value
                 
-                if magic == consts.PE64:
-                    entry = self.getQwordAtRva(iltRva).value
-                elif magic == consts.PE32:
-                    entry = self.getDwordAtRva(iltRva).value
+                entry = unpackThunk(getDataAtRva(iltRva, thunkSize))[0]
 
                 while entry != 0:
-                    
-                    if magic == consts.PE64:
-                        iatEntry = directories.ImportAddressTableEntry64()
-                    elif magic == consts.PE32:
-                        iatEntry = directories.ImportAddressTableEntry()
-                        
+                    iatEntry = iatEntryClass()
                     iatEntry.originalFirstThunk.value = entry
                     
-                    if iatEntry.originalFirstThunk.value & ORDINAL_FLAG:
+                    if entry & ORDINAL_FLAG:
                         iatEntry.hint.value = None
-                        iatEntry.name.value = iatEntry.originalFirstThunk.value & ADDRESS_MASK
+                        iatEntry.name.value = entry & ADDRESS_MASK
                     else: 
-                        iatEntry.hint.value = self.getWordAtRva(iatEntry.originalFirstThunk.value).value
-                        iatEntry.name.value = self.readStringAtRva(iatEntry.originalFirstThunk.value + 2).value
+                        iatEntry.hint.value = _hintStruct.unpack(getDataAtRva(entry, 2))[0]
+                        iatEntry.name.value = readStringAtRva(entry + 2).value
                     
-                    if magic == consts.PE64:
-                        iatEntry.firstThunk.value = self.getQwordAtRva(iatRva).value
-                        iltRva += 8
-                        iatRva += 8
-                        entry = self.getQwordAtRva(iltRva).value
-                    elif magic == consts.PE32:
-                        iatEntry.firstThunk.value = self.getDwordAtRva(iatRva).value                        
-                        iltRva += 4
-                        iatRva += 4
-                        entry = self.getDwordAtRva(iltRva).value                        
+                    iatEntry.firstThunk.value = unpackThunk(getDataAtRva(iatRva, thunkSize))[0]
+                    iltRva += thunkSize
+                    iatRva += thunkSize
+                    entry = unpackThunk(getDataAtRva(iltRva, thunkSize))[0]
                     
-                    iid[i].iat.append(iatEntry)
+                    appendIatEntry(iatEntry)
                     
             else:
                 iatRva = iid[i].firstThunk.value
                 
-                if magic == consts.PE64:
-                    entry = self.getQwordAtRva(iatRva).value
-                elif magic == consts.PE32:
-                    entry = self.getDwordAtRva(iatRva).value
+                entry = unpackThunk(getDataAtRva(iatRva, thunkSize))[0]
                     
                 while entry != 0:
-
-                    if magic == consts.PE64:
-                        iatEntry = directories.ImportAddressTableEntry64()
-                    elif magic == consts.PE32:
-                        iatEntry = directories.ImportAddressTableEntry()
-                    
+                    iatEntry = iatEntryClass()
                     iatEntry.firstThunk.value = entry
                     iatEntry.originalFirstThunk.value = 0
                     
                     if not peIsBounded:
-                        ft = iatEntry.firstThunk.value
-
-                        if ft & ORDINAL_FLAG:
+                        if entry & ORDINAL_FLAG:
                             iatEntry.hint.value = None
-                            iatEntry.name.value = ft & ADDRESS_MASK
+                            iatEntry.name.value = entry & ADDRESS_MASK
                         else:
-                            iatEntry.hint.value = self.getWordAtRva(ft).value
-                            iatEntry.name.value = self.readStringAtRva(ft + 2).value                            
+                            iatEntry.hint.value = _hintStruct.unpack(getDataAtRva(entry, 2))[0]
+                            iatEntry.name.value = readStringAtRva(entry + 2).value
                     else:
                         iatEntry.hint.value = None
                         iatEntry.name.value = None
                 
-                    if magic == consts.PE64:
-                        iatRva += 8
-                        entry = self.getQwordAtRva(iatRva).value
-                    elif magic == consts.PE32:
-                        iatRva += 4
-                        entry = self.getDwordAtRva(iatRva).value
-
-                    iid[i].iat.append(iatEntry)
+                    iatRva += thunkSize
+                    entry = unpackThunk(getDataAtRva(iatRva, thunkSize))[0]
+
+                    appendIatEntry(iatEntry)
              
-            iid[i].metaData.moduleName.value = self.readStringAtRva(iid[i].name.value).value
+            iid[i].metaData.moduleName.value = readStringAtRva(iid[i].name.value).value
             iid[i].metaData.numberOfImports.value = len(iid[i].iat)
         return iid
         
@@ -1403,7 +1415,7 @@ class PE(object):
         numberOfStreams = netDirectoryClass.netMetaDataHeader.numberOfStreams.value
         netDirectoryClass.netMetaDataStreams = directories.NetMetaDataStreams.parse(rd, numberOfStreams)
 
-        for i in range(numberOfStreams):
+        for i in xrange(numberOfStreams):
             stream = netDirectoryClass.netMetaDataStreams[i]
             name = stream.name.value
             rd.setOffset(stream.offset.value)
@@ -1428,7 +1440,7 @@ class PE(object):
                     offset = rd2.tell()
                     stream.info.append({ offset: rd2.readDotNetBlob() })
 
-        for i in range(numberOfStreams):
+        for i in xrange(numberOfStreams):
             stream = netDirectoryClass.netMetaDataStreams[i]
             name = stream.name.value
             if name == "#~" or i == 0:
@@ -1512,6 +1524,8 @@ class PE(object):
                         if entry.name.value == funcName:
                             retval = True
                             break
+                    if retval:
+                        break
             else:
                 print "WARNING: IMPORT_DIRECTORY not found on PE!"
         else:
@@ -1572,6 +1586,10 @@ class PE(object):
 
 class DosHeader(baseclasses.BaseStructClass):
     """DosHeader object."""
+
+    _attrsList = ("e_magic","e_cblp","e_cp","e_crlc","e_cparhdr","e_minalloc","e_maxalloc","e_ss","e_sp","e_csum",\
+                  "e_ip","e_cs","e_lfarlc","e_ovno","e_res","e_oemid","e_oeminfo","e_res2","e_lfanew")
+
     def __init__(self,  shouldPack = True):
          """
          Class representation of the C{IMAGE_DOS_HEADER} structure. 
@@ -1610,9 +1628,6 @@ class DosHeader(baseclasses.BaseStructClass):
         
          self.e_lfanew = datatypes.DWORD(0xf0) #: L{DWORD} e_lfanew.
          
-         self._attrsList = ["e_magic","e_cblp","e_cp","e_crlc","e_cparhdr","e_minalloc","e_maxalloc","e_ss","e_sp","e_csum",\
-         "e_ip","e_cs","e_lfarlc","e_ovno","e_res","e_oemid","e_oeminfo","e_res2","e_lfanew"]
-         
     @staticmethod
     def parse(readDataInstance):
         """
@@ -1641,16 +1656,12 @@ class DosHeader(baseclasses.BaseStructClass):
         dosHdr.e_lfarlc.value  = readDataInstance.readWord()
         dosHdr.e_ovno.value  = readDataInstance.readWord()
         
-        dosHdr.e_res = datatypes.Array(datatypes.TYPE_WORD)
-        for i in range(4):
-            dosHdr.e_res.append(datatypes.WORD(readDataInstance.readWord()))
+        dosHdr.e_res = datatypes.Array.parse(readDataInstance, datatypes.TYPE_WORD, 4)
             
         dosHdr.e_oemid.value  = readDataInstance.readWord()
         dosHdr.e_oeminfo.value  = readDataInstance.readWord()
 
-        dosHdr.e_res2 = datatypes.Array(datatypes.TYPE_WORD)
-        for i in range (10):
-            dosHdr.e_res2.append(datatypes.WORD(readDataInstance.readWord()))
+        dosHdr.e_res2 = datatypes.Array.parse(readDataInstance, datatypes.TYPE_WORD, 10)
         
         dosHdr.e_lfanew.value = readDataInstance.readDword()
         return dosHdr
@@ -1661,6 +1672,9 @@ class DosHeader(baseclasses.BaseStructClass):
         
 class NtHeaders(baseclasses.BaseStructClass):
     """NtHeaders object."""
+
+    _attrsList = ("signature", "fileHeader", "optionalHeader")
+
     def __init__(self, shouldPack = True):
         """
         Class representation of the C{IMAGE_NT_HEADERS} structure.
@@ -1674,9 +1688,6 @@ class NtHeaders(baseclasses.BaseStructClass):
         self.signature = datatypes.DWORD(consts.PE_SIGNATURE) #: L{DWORD} signature.
         self.fileHeader = FileHeader() #: L{FileHeader} fileHeader.
         self.optionalHeader = OptionalHeader() #: L{OptionalHeader} optionalHeader.
-        
-    def __str__(self):
-        return str(self.signature) + str(self.fileHeader) + str(self.optionalHeader)
 
     @staticmethod
     def parse(readDataInstance):
@@ -1701,6 +1712,10 @@ class NtHeaders(baseclasses.BaseStructClass):
         
 class FileHeader(baseclasses.BaseStructClass):
     """FileHeader object."""
+
+    _attrsList = ("machine","numberOfSections","timeDateStamp","pointerToSymbolTable","numberOfSymbols",\
+                  "sizeOfOptionalHeader","characteristics")
+
     def __init__(self,  shouldPack = True):
         """
         Class representation of the C{IMAGE_FILE_HEADER} structure. 
@@ -1719,9 +1734,6 @@ class FileHeader(baseclasses.BaseStructClass):
         self.sizeOfOptionalHeader = datatypes.WORD(0xe0) #: L{WORD} sizeOfOptionalHeader.
         self.characteristics = datatypes.WORD(consts.COMMON_CHARACTERISTICS) #: L{WORD} characteristics.
     
-        self._attrsList = ["machine","numberOfSections","timeDateStamp","pointerToSymbolTable","numberOfSymbols",\
-        "sizeOfOptionalHeader","characteristics"]
-    
     @staticmethod
     def parse(readDataInstance):
         """
@@ -1749,6 +1761,14 @@ class FileHeader(baseclasses.BaseStructClass):
         
 class OptionalHeader(baseclasses.BaseStructClass):
     """OptionalHeader object."""
+
+    _attrsList = ("magic","majorLinkerVersion","minorLinkerVersion","sizeOfCode","sizeOfInitializedData",\
+                  "sizeOfUninitializedData","addressOfEntryPoint","baseOfCode","baseOfData","imageBase","sectionAlignment",\
+                  "fileAlignment","majorOperatingSystemVersion","minorOperatingSystemVersion","majorImageVersion",\
+                  "minorImageVersion","majorSubsystemVersion","minorSubsystemVersion","win32VersionValue","sizeOfImage",\
+                  "sizeOfHeaders","checksum","subsystem","dllCharacteristics","sizeOfStackReserve","sizeOfStackCommit",\
+                  "sizeOfHeapReserve","sizeOfHeapCommit","loaderFlags","numberOfRvaAndSizes","dataDirectory")
+
     def __init__(self,  shouldPack = True):
         """
         Class representation of the C{IMAGE_OPTIONAL_HEADER} structure.
@@ -1791,13 +1811,6 @@ class OptionalHeader(baseclasses.BaseStructClass):
         self.numberOfRvaAndSizes = datatypes.DWORD(0x10) #: L{DWORD} numberOfRvaAndSizes.
         self.dataDirectory = datadirs.DataDirectory() #: L{DataDirectory} dataDirectory.
         
-        self._attrsList = ["magic","majorLinkerVersion","minorLinkerVersion","sizeOfCode","sizeOfInitializedData",\
-        "sizeOfUninitializedData","addressOfEntryPoint","baseOfCode","baseOfData","imageBase","sectionAlignment",\
-        "fileAlignment","majorOperatingSystemVersion","minorOperatingSystemVersion","majorImageVersion",\
-        "minorImageVersion","majorSubsystemVersion","minorSubsystemVersion","win32VersionValue","sizeOfImage",\
-        "sizeOfHeaders","checksum","subsystem","dllCharacteristics","sizeOfStackReserve","sizeOfStackCommit",\
-        "sizeOfHeapReserve","sizeOfHeapCommit","loaderFlags","numberOfRvaAndSizes","dataDirectory"]
-        
     @staticmethod
     def parse(readDataInstance):
         """
@@ -1886,6 +1899,14 @@ class OptionalHeader(baseclasses.BaseStructClass):
 # } IMAGE_OPTIONAL_HEADER64, *PIMAGE_OPTIONAL_HEADER64;
 class OptionalHeader64(baseclasses.BaseStructClass):
     """OptionalHeader64 object."""
+
+    _attrsList = ("magic","majorLinkerVersion","minorLinkerVersion","sizeOfCode","sizeOfInitializedData",\
+                  "sizeOfUninitializedData","addressOfEntryPoint","baseOfCode", "imageBase","sectionAlignment",\
+                  "fileAlignment","majorOperatingSystemVersion","minorOperatingSystemVersion","majorImageVersion",\
+                  "minorImageVersion","majorSubsystemVersion","minorSubsystemVersion","win32VersionValue","sizeOfImage",\
+                  "sizeOfHeaders","checksum","subsystem","dllCharacteristics","sizeOfStackReserve","sizeOfStackCommit",\
+                  "sizeOfHeapReserve","sizeOfHeapCommit","loaderFlags","numberOfRvaAndSizes","dataDirectory")
+
     def __init__(self,  shouldPack = True):
         """
         Class representation of the C{IMAGE_OPTIONAL_HEADER64} structure. 
@@ -1927,13 +1948,6 @@ class OptionalHeader64(baseclasses.BaseStructClass):
         self.numberOfRvaAndSizes = datatypes.DWORD(0x10) #: L{DWORD} numberOfRvaAndSizes.
         self.dataDirectory = datadirs.DataDirectory() #: L{DataDirectory} dataDirectory.
         
-        self._attrsList = ["magic","majorLinkerVersion","minorLinkerVersion","sizeOfCode","sizeOfInitializedData",\
-        "sizeOfUninitializedData","addressOfEntryPoint","baseOfCode", "imageBase","sectionAlignment",\
-        "fileAlignment","majorOperatingSystemVersion","minorOperatingSystemVersion","majorImageVersion",\
-        "minorImageVersion","majorSubsystemVersion","minorSubsystemVersion","win32VersionValue","sizeOfImage",\
-        "sizeOfHeaders","checksum","subsystem","dllCharacteristics","sizeOfStackReserve","sizeOfStackCommit",\
-        "sizeOfHeapReserve","sizeOfHeapCommit","loaderFlags","numberOfRvaAndSizes","dataDirectory"]
-        
     @staticmethod
     def parse(readDataInstance):
         """
@@ -1989,6 +2003,10 @@ class OptionalHeader64(baseclasses.BaseStructClass):
 
 class SectionHeader(baseclasses.BaseStructClass):
     """SectionHeader object."""
+
+    _attrsList = ("name","misc","virtualAddress","sizeOfRawData","pointerToRawData","pointerToRelocations",\
+                  "pointerToLineNumbers","numberOfRelocations","numberOfLinesNumbers","characteristics")
+
     def __init__(self,  shouldPack = True):
         """
         Class representation of the C{IMAGE_SECTION_HEADER} structure.
@@ -2009,9 +2027,6 @@ class SectionHeader(baseclasses.BaseStructClass):
         self.numberOfRelocations = datatypes.WORD(0) #: L{WORD} numberOfRelocations.
         self.numberOfLinesNumbers = datatypes.WORD(0) #: L{WORD} numberOfLinesNumbers.
         self.characteristics = datatypes.DWORD(0x60000000) #: L{DWORD} characteristics.
-        
-        self._attrsList = ["name","misc","virtualAddress","sizeOfRawData","pointerToRawData","pointerToRelocations",\
-        "pointerToLineNumbers","numberOfRelocations","numberOfLinesNumbers","characteristics"]
      
     @staticmethod
     def parse(readDataInstance):
@@ -2053,14 +2068,9 @@ class SectionHeaders(list):
         @type numberOfSectionHeaders: int
         @param numberOfSectionHeaders: (Optional) The number of desired section headers. By default, this parameter is set to 1.
         """
-        list.__init__(self)
+        list.__init__(self, [SectionHeader() for _ in repeat(None, numberOfSectionHeaders)])
         
         self.shouldPack = shouldPack
-        
-        if numberOfSectionHeaders:
-            for i in range(numberOfSectionHeaders):
-                sh = SectionHeader()
-                self.append(sh)
                 
     def __str__(self):
         return "".join([str(x) for x in self if x.shouldPack])
@@ -2077,23 +2087,7 @@ class SectionHeaders(list):
         @param numberOfSectionHeaders: The number of L{SectionHeader} objects in the L{SectionHeaders} instance.
         """
         sHdrs = SectionHeaders(numberOfSectionHeaders = 0)
-        
-        for i in range(numberOfSectionHeaders):
-            sh = SectionHeader()
-            
-            sh.name.value = readDataInstance.read(8)
-            sh.misc.value = readDataInstance.readDword()
-            sh.virtualAddress.value = readDataInstance.readDword()
-            sh.sizeOfRawData.value = readDataInstance.readDword()
-            sh.pointerToRawData.value = readDataInstance.readDword()
-            sh.pointerToRelocations.value = readDataInstance.readDword()
-            sh.pointerToLineNumbers.value = readDataInstance.readDword()
-            sh.numberOfRelocations.value = readDataInstance.readWord()
-            sh.numberOfLinesNumbers.value = readDataInstance.readWord()
-            sh.characteristics.value = readDataInstance.readDword()
-        
-            sHdrs.append(sh)
-        
+        sHdrs.extend([SectionHeader.parse(readDataInstance) for _ in repeat(None, numberOfSectionHeaders)])
         return sHdrs
         
 class Sections(list):
@@ -46,7 +46,7 @@ import excep
 
 from cStringIO import StringIO as cstringio
 from StringIO import StringIO
-from struct import pack, unpack
+from struct import pack, unpack_from
 import uuid
 
 def powerOfTwo(value):
@@ -213,7 +213,7 @@ class ReadData(object):
         @rtype: int
         @return: The dword value read from the L{ReadData} stream.
         """
-        dword = unpack(self.endianness + ('L' if not self.signed else 'l'), self.readAt(self.offset,  4))[0]
+        dword = unpack_from(self.endianness + ('L' if not self.signed else 'l'), self.data, self.offset)[0]
         self.offset += 4
         return dword
 
@@ -224,7 +224,7 @@ class ReadData(object):
         @rtype: int
         @return: The word value read from the L{ReadData} stream.
         """
-        word = unpack(self.endianness + ('H' if not self.signed else 'h'), self.readAt(self.offset, 2))[0]
+        word = unpack_from(self.endianness + ('H' if not self.signed else 'h'), self.data, self.offset)[0]
         self.offset += 2
         return word
         
@@ -235,7 +235,7 @@ class ReadData(object):
         @rtype: int
         @return: The byte value read from the L{ReadData} stream.
         """
-        byte = unpack('B' if not self.signed else 'b', self.readAt(self.offset, 1))[0]
+        byte = unpack_from('B' if not self.signed else 'b', self.data, self.offset)[0]
         self.offset += 1
         return byte
     
@@ -246,21 +246,43 @@ class ReadData(object):
         @rtype: int
         @return: The qword value read from the L{ReadData} stream.
         """
-        qword = unpack(self.endianness + ('Q' if not self.signed else 'b'),  self.readAt(self.offset, 8))[0]
+        qword = unpack_from(self.endianness + ('Q' if not self.signed else 'q'), self.data, self.offset)[0]
         self.offset += 8
         return qword
-        
+
+    def readStruct(self, structInstance):
+        """
+        Reads all the fields described by a C{struct.Struct} object from the L{ReadData} stream object at once.
+
+        @type structInstance: C{struct.Struct}
+        @param structInstance: The compiled format describing the fields to read.
+
+        @rtype: tuple
+        @return: The values read from the L{ReadData} stream.
+
+        @raise DataLengthException: The size of the format is greater than the remaining bytes in the L{ReadData} stream.
+        """
+        if structInstance.size > self.length - self.offset:
+            raise excep.DataLengthException("Not enough bytes to read.")
+        values = structInstance.unpack_from(self.data, self.offset)
+        self.offset += structInstance.size
+        return values
+
     def readString(self):
         """
         Reads an ASCII string from the L{ReadData} stream object.
         
         @rtype: str
         @return: An ASCII string read form the stream.
+        
+        @raise DataLengthException: The string is not terminated before the end of the L{ReadData} stream.
         """
-        resultStr = ""
-        while self.data[self.offset] != "\x00":
-            resultStr += self.data[self.offset]
-            self.offset += 1
+        # look for the terminator with a single find() instead of walking the string byte by byte.
+        end = self.data.find("\x00", self.offset, self.length)
+        if end == -1:
+            raise excep.DataLengthException("Not enough bytes to read.")
+        resultStr = self.data[self.offset:end]
+        self.offset = end
         return resultStr
 
     def readAlignedString(self, align = 4):
@@ -272,13 +294,15 @@ class ReadData(object):
         
         @rtype: str
         @return: A 4-bytes aligned (default) ASCII string.
+        
+        @raise DataLengthException: Not enough bytes to read the string and its padding.
         """
         s = self.readString()
         r = align - len(s) % align
-        while r:
-            s += self.data[self.offset]
-            self.offset += 1
-            r -= 1
+        if r > self.length - self.offset:
+            raise excep.DataLengthException("Not enough bytes to read.")
+        s += self.data[self.offset:self.offset + r]
+        self.offset += r
         return s.rstrip("\x00")
         
     def read(self, nroBytes):